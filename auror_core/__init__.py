@@ -1,38 +1,106 @@
 import copy
+import io
+import itertools
 import os
 
+from auror_core.graph import FlowGraph
+from auror_core.stats import NO_STATS
+from auror_core.writer import write_files, write_incremental, write_zip
+
 
 class Project(object):
 
     def __init__(self, folder, *jobtypes):
         self.jobtypes = jobtypes
         self.folder = folder
-        self.params = []
+        self.params = ()
         self.version = 1
 
+    # projects are immutable, a changed project shares
+    # its jobs and params with the project it came from
+    def __replace(self, **changes):
+        project = copy.copy(self)
+        project.__dict__.update(changes)
+        return project
+
     def is_v2(self):
-        self.version = 2
-        return copy.deepcopy(self)
+        return self.__replace(version=2)
 
     def is_v1(self):
-        self.version = 1
-        return copy.deepcopy(self)
+        return self.__replace(version=1)
 
     def with_params(self, *paramtypes):
-        self.params = paramtypes
-        return copy.deepcopy(self)
+        return self.__replace(params=paramtypes)
+
+    def graph(self):
+        return FlowGraph(self.jobtypes)
+
+    # stats (auror_core.stats.WriteStats) collects the time spent
+    # on each phase and job, the files and the bytes written
+    def write(self, incremental=False, validate=True, backend=None,
+              stats=None):
+        write = write_incremental if incremental else write_files
+        return self.__write(
+            lambda files: write(self.folder, files, backend), validate, stats)
+
+    # coroutine version of write, run in the event loop's default
+    # executor. Python 3 only, the coroutine lives in auror_core.aio
+    def write_async(self, incremental=False, validate=True, backend=None,
+                    stats=None):
+        from auror_core.aio import write_async
 
-    def write(self):
+        return write_async(self, incremental, validate, backend, stats)
 
-        for param in self.params:
-            param._add_items()
-            param._write(self.folder)
+    def to_zip(self, fileobj, validate=True, stats=None):
+        return self.__write(
+            lambda files: write_zip(fileobj, files), validate, stats)
 
-        for jobtype in self.jobtypes:
-            jobtype._add_items()
-            jobtype._write(self.folder)
+    def to_zip_bytes(self, validate=True, stats=None):
+        fileobj = io.BytesIO()
+        self.to_zip(fileobj, validate, stats)
+        return fileobj.getvalue()
 
+    # files are produced lazily while they are written, serialization
+    # is timed on its own and left out of the write phase
+    def __write(self, write, validate, stats):
+        stats = stats or NO_STATS
+        files = stats.files(self.__checked_files(validate, stats))
+        with stats.time("write"):
+            report = write(files)
+        stats.finish(report)
+        return report
+
+    # unknown dependencies and cycles are reported before any file is touched
+    def __checked_files(self, validate, stats=NO_STATS):
+        if validate:
+            with stats.time("validate"):
+                self.graph().validate()
+        return self._files(stats)
+
+    # yields the name and the serialized content of every project file
+    def _files(self, stats=NO_STATS):
         if self.version == 2:
-            project_path = os.path.join(self.folder, 'flow20.project')
-            with open(project_path, 'w') as project:
-                project.write('azkaban-flow-version: 2.0')
+            for project_file in self.__files_v2(stats):
+                yield project_file
+            return
+
+        for jobtype in itertools.chain(self.params, self.jobtypes):
+            with stats.time("prepare", jobtype):
+                items = jobtype._all_properties()
+            with stats.time("serialize", jobtype):
+                content = jobtype._dumps(items)
+            yield jobtype._file_name(), content
+
+    # the whole flow is serialized in memory and the .flow file
+    # is written once, instead of being re-read and re-dumped per job
+    def __files_v2(self, stats):
+        from auror_core.v2.serializer import FlowSerializer
+
+        with stats.time("serialize"):
+            content = FlowSerializer(stats) \
+                .add_params(*self.params) \
+                .add_jobs(*self.jobtypes) \
+                .dumps()
+        name = os.path.basename(self.folder)
+        yield "{}.flow".format(name), content
+        yield "flow20.project", "azkaban-flow-version: 2.0"
@@ -0,0 +1,12 @@
+import asyncio
+import functools
+
+
+# Project.write_async, kept out of auror_core so the package
+# still imports on python 2
+async def write_async(project, incremental=False, validate=True,
+                      backend=None, stats=None):
+    loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+    write = functools.partial(
+        project.write, incremental, validate, backend, stats)
+    return await loop.run_in_executor(None, write)
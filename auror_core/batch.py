@@ -0,0 +1,120 @@
+from __future__ import print_function
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import runpy
+import sys
+import time
+import traceback
+
+from collections import namedtuple
+
+
+WriteResult = namedtuple("WriteResult", ["name", "seconds", "error"])
+
+
+def _timed(name, function, *args):
+    start = time.time()
+    try:
+        function(*args)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return WriteResult(name, time.time() - start, error)
+
+
+# projects are pickled beforehand, so one project that can not be sent
+# to the workers is reported as its own error instead of aborting the batch
+def _write_pickled_project(payload):
+    name, project = payload
+    return _timed(name, lambda: pickle.loads(project).write())
+
+
+def _run_script(path):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    return _timed(path, _run_script_as_main, path)
+
+
+def _run_script_as_main(path):
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as exit:
+        if exit.code:
+            raise RuntimeError("{} exited with {}".format(path, exit.code))
+
+
+def _convert_project(folders):
+    from auror_core.v2.converter import convert
+
+    source, destination = folders
+    return _timed(source, convert, source, destination)
+
+
+def _map(function, items, workers):
+    if workers == 1:
+        return [function(item) for item in items]
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        return pool.map(function, items, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def write_projects(projects, workers=None):
+    results = []
+    payloads = []
+    for project in projects:
+        try:
+            payload = pickle.dumps(project, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            results.append(WriteResult(
+                project.folder, 0.0, traceback.format_exc()))
+        else:
+            results.append(None)
+            payloads.append((project.folder, payload))
+
+    written = iter(_map(_write_pickled_project, payloads, workers))
+    return [result or next(written) for result in results]
+
+
+def run_scripts(paths, workers=None):
+    return _map(_run_script, list(paths), workers)
+
+
+# (v1 source folder, v2 destination folder) pairs
+def convert_projects(folders, workers=None):
+    return _map(_convert_project, list(folders), workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="auror-batch",
+        description="Run many Auror project scripts in parallel")
+    parser.add_argument(
+        "scripts", nargs="+", metavar="script",
+        help="python script that writes one or more projects")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="number of worker processes (default: number of CPUs)")
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    results = run_scripts(args.scripts, args.workers)
+    for result in results:
+        status = "FAIL" if result.error else "ok"
+        print("{:<4} {:>9.3f}s {}".format(status, result.seconds, result.name))
+        if result.error:
+            print(result.error)
+
+    failures = sum(1 for result in results if result.error)
+    print("{} scripts, {} failed in {:.3f}s".format(
+        len(results), failures, time.time() - start))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
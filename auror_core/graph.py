@@ -0,0 +1,176 @@
+from collections import OrderedDict
+
+
+class InvalidFlowError(ValueError):
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super(InvalidFlowError, self).__init__(
+            "Invalid flow:\n{}".format("\n".join(self.errors)))
+
+
+# dependency graph of the jobs of one flow level, dependencies are
+# resolved between siblings and nested v2 nodes get a graph of their own
+class FlowGraph(object):
+
+    def __init__(self, jobs, path=()):
+        self.path = tuple(path)
+        self.jobs = OrderedDict()
+        self.dependencies = dict()
+        self.flows = OrderedDict()
+        self.types = OrderedDict()
+        self.duplicates = []
+
+        for job in jobs:
+            name = job.name
+            if name in self.dependencies:
+                self.duplicates.append(name)
+                continue
+            self.jobs[name] = job
+            self.dependencies[name] = job.dependencies
+            self.types.setdefault(
+                getattr(job, "_type", None), []).append(name)
+            if getattr(job, "nodes", None):
+                self.flows[name] = FlowGraph(job.nodes, self.path + (name,))
+
+        # in-degrees are counted once here, every sort starts from a copy
+        self.dependents = dict((name, []) for name in self.jobs)
+        self.__pending = dict()
+        for name in self.jobs:
+            dependencies = self.dependencies[name]
+            if len(dependencies) > 1:
+                dependencies = OrderedDict.fromkeys(dependencies)
+            pending = 0
+            for dependency in dependencies:
+                if dependency in self.dependents:
+                    self.dependents[dependency].append(name)
+                    pending += 1
+            self.__pending[name] = pending
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __iter__(self):
+        return iter(self.jobs.values())
+
+    def __contains__(self, name):
+        return name in self.jobs
+
+    def __getitem__(self, name):
+        return self.jobs[name]
+
+    def of_type(self, job_type):
+        return [self.jobs[name] for name in self.types.get(job_type, ())]
+
+    # nested jobs are found by their path, "flow/inner" or ("flow", "inner")
+    def find(self, path):
+        if not isinstance(path, (list, tuple)):
+            path = path.split("/")
+        graph = self
+        for name in path[:-1]:
+            graph = graph.flows[name]
+        return graph[path[-1]]
+
+    def subgraph(self, path):
+        if not isinstance(path, (list, tuple)):
+            path = path.split("/")
+        graph = self
+        for name in path:
+            graph = graph.flows[name]
+        return graph
+
+    # the job and everything it depends on, directly or not
+    def upstream(self, name):
+        return self.__closure(name, self.dependencies)
+
+    # the job and everything depending on it, directly or not
+    def downstream(self, name):
+        return self.__closure(name, self.dependents)
+
+    # (job name, dependency) for every dependency that is not a sibling
+    def unknown_dependencies(self):
+        return [
+            (name, dependency)
+            for name, dependencies in self.dependencies.items()
+            for dependency in dependencies
+            if dependency not in self.jobs
+        ]
+
+    # Kahn's algorithm, ties keep the order the jobs were given in
+    def topological_order(self):
+        order = self.__sort()
+        if len(order) < len(self.jobs):
+            raise InvalidFlowError([self.__describe_cycle(order)])
+        return [self.jobs[name] for name in order]
+
+    # names of the jobs in one dependency cycle, None if there is none
+    def find_cycle(self):
+        order = self.__sort()
+        if len(order) == len(self.jobs):
+            return None
+        return self.__cycle(order)
+
+    def errors(self):
+        prefix = "/".join(self.path)
+        prefix = "{}: ".format(prefix) if prefix else ""
+        errors = [
+            "{}duplicated job '{}'".format(prefix, name)
+            for name in self.duplicates
+        ]
+        errors.extend(
+            "{}job '{}' depends on unknown job '{}'".format(
+                prefix, name, dependency)
+            for name, dependency in self.unknown_dependencies())
+        order = self.__sort()
+        if len(order) < len(self.jobs):
+            errors.append(prefix + self.__describe_cycle(order))
+        for flow in self.flows.values():
+            errors.extend(flow.errors())
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise InvalidFlowError(errors)
+        return self
+
+    def __closure(self, name, edges):
+        found = [name]
+        seen = set(found)
+        for current in found:
+            for other in edges[current]:
+                if other in self.jobs and other not in seen:
+                    seen.add(other)
+                    found.append(other)
+        return FlowGraph(
+            (self.jobs[name] for name in found), self.path)
+
+    def __sort(self):
+        pending = dict(self.__pending)
+        order = [name for name in self.jobs if not pending[name]]
+        for name in order:
+            for dependent in self.dependents[name]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    order.append(dependent)
+        return order
+
+    # every job left out of the order still waits for another one left
+    # out, so following those dependencies always ends up in a cycle
+    def __cycle(self, order):
+        sorted_names = set(order)
+        name = next(name for name in self.jobs if name not in sorted_names)
+        seen = OrderedDict()
+        while name not in seen:
+            seen[name] = len(seen)
+            name = next(
+                dependency for dependency in self.dependencies[name]
+                if dependency in self.jobs and dependency not in sorted_names)
+        cycle = list(seen)[seen[name]:]
+        cycle.reverse()
+        return cycle
+
+    def __describe_cycle(self, order):
+        cycle = self.__cycle(order)
+        return "dependency cycle {}".format(
+            " -> ".join("'{}'".format(name) for name in cycle + cycle[:1]))
@@ -0,0 +1,168 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+try:
+    from sys import intern
+except ImportError:
+    pass
+
+
+# immutable mapping, merge stacks the new items over the current ones
+# instead of copying them, so derived maps share the unchanged data
+class PersistentMap(Mapping):
+
+    __slots__ = ("_parent", "_items", "_depth")
+
+    MAX_DEPTH = 16
+
+    def __init__(self, items=None):
+        self._parent = None
+        items = items or {}
+        self._items = dict(zip(map(intern_key, items.keys()), items.values()))
+        self._depth = 0
+
+    def merge(self, items):
+        if not items:
+            return self
+        parent = self
+        if self._depth >= self.MAX_DEPTH:
+            parent = self.__squash(self.MAX_DEPTH // 2)
+        merged = PersistentMap(items)
+        merged._parent = parent
+        merged._depth = parent._depth + 1
+        return merged
+
+    # squashes the newest layers into one, the older (and usually
+    # bigger) layers below them are still shared
+    def __squash(self, count):
+        layers = []
+        layer = self
+        for _ in range(count):
+            layers.append(layer._items)
+            layer = layer._parent
+        squashed = PersistentMap()
+        for items in reversed(layers):
+            squashed._items.update(items)
+        if layer is not None:
+            squashed._parent = layer
+            squashed._depth = layer._depth + 1
+        return squashed
+
+    def as_dict(self):
+        flat = dict()
+        for items in self.__layers():
+            flat.update(items)
+        return flat
+
+    def __layers(self):
+        layers = []
+        layer = self
+        while layer is not None:
+            layers.append(layer._items)
+            layer = layer._parent
+        return reversed(layers)
+
+    def __getitem__(self, key):
+        layer = self
+        while layer is not None:
+            if key in layer._items:
+                return layer._items[key]
+            layer = layer._parent
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        layer = self
+        while layer is not None:
+            if key in layer._items:
+                return True
+            layer = layer._parent
+        return False
+
+    def __iter__(self):
+        if self._parent is None:
+            return iter(self._items)
+        return iter(self.as_dict())
+
+    def __len__(self):
+        if self._parent is None:
+            return len(self._items)
+        return len(self.as_dict())
+
+    def items(self):
+        return self.as_dict().items()
+
+    def __bool__(self):
+        layer = self
+        while layer is not None:
+            if layer._items:
+                return True
+            layer = layer._parent
+        return False
+
+    __nonzero__ = __bool__
+
+    def __reduce__(self):
+        return self.__class__, (self.as_dict(),)
+
+    def __repr__(self):
+        return repr(self.as_dict())
+
+
+# the same key text is held once, however many jobs use it
+def intern_key(key):
+    return intern(key) if type(key) is str else key
+
+
+EMPTY = PersistentMap()
+
+
+def freeze(items):
+    if items is None:
+        return EMPTY
+    if isinstance(items, dict):
+        return PersistentMap(items)
+    return items
+
+
+def freeze_names(names):
+    if type(names) is tuple:
+        return names
+    return tuple(intern_key(name) for name in names or ())
+
+
+# properties are filled by _add_items, which most jobs never go through,
+# so the container is only allocated when it is first used
+class LazyProperties(object):
+
+    __slots__ = ("_properties",)
+
+    def _new_properties(self):
+        return dict()
+
+    def _current_properties(self):
+        if self._properties is None:
+            return self._new_properties()
+        return self._properties
+
+    # the properties as _add_items, overridden by plugin types or not,
+    # leaves them, run over a copy so the object itself never changes
+    def _all_properties(self):
+        current = self._properties
+        self._properties = dict(current or self._new_properties())
+        try:
+            self._add_items()
+            return self._properties
+        finally:
+            self._properties = current
+
+    @property
+    def properties(self):
+        if self._properties is None:
+            self._properties = self._new_properties()
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties):
+        self._properties = properties
@@ -0,0 +1,209 @@
+import time
+
+from contextlib import contextmanager
+
+from auror_core.writer import _encode
+
+_clock = getattr(time, "perf_counter", time.time)
+
+PHASES = ("validate", "prepare", "serialize", "write")
+
+
+class _NullTimer(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+# what Project uses when no stats are asked for, every call is a no-op
+class _NullStats(object):
+
+    __timer = _NullTimer()
+
+    def time(self, phase, job=None):
+        return self.__timer
+
+    def files(self, files):
+        return files
+
+    def finish(self, report):
+        pass
+
+
+NO_STATS = _NullStats()
+
+
+# timings of one Project.write (or to_zip): seconds per phase, per job
+# and per job type, files produced and bytes written. Phases are timed
+# exclusively, time spent in a phase started inside another one only
+# counts for the inner one, so the phases add up to the whole write.
+# Sinks are called with the stats once the write is done
+class WriteStats(object):
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+        self.phases = dict((phase, 0.0) for phase in PHASES)
+        self.jobs = dict()
+        self.files_produced = 0
+        self.files_written = 0
+        self.bytes_written = 0
+        self.__sizes = dict()
+        self.__nested = []
+
+    @contextmanager
+    def time(self, phase, job=None):
+        self.__nested.append(0.0)
+        start = _clock()
+        try:
+            yield self
+        finally:
+            elapsed = _clock() - start
+            nested = self.__nested.pop()
+            if self.__nested:
+                self.__nested[-1] += elapsed
+            self.add(phase, elapsed - nested, job)
+
+    def add(self, phase, seconds, job=None):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        if job is not None:
+            key = _job_type(job), _job_name(job)
+            self.jobs[key] = self.jobs.get(key, 0.0) + seconds
+
+    # files are encoded here, the writers leave bytes as they are
+    def files(self, files):
+        for name, content in files:
+            data = _encode(content)
+            self.files_produced += 1
+            self.__sizes[name] = len(data)
+            yield name, data
+
+    def finish(self, report):
+        self.files_written += len(report.written)
+        self.bytes_written += sum(
+            self.__sizes.get(name, 0) for name in report.written)
+        for sink in self.sinks:
+            sink(self)
+
+    @property
+    def seconds(self):
+        return sum(self.phases.values())
+
+    # {job type: {"count": jobs, "seconds": time spent on them}}
+    @property
+    def job_types(self):
+        job_types = dict()
+        for (job_type, _), seconds in self.jobs.items():
+            totals = job_types.setdefault(
+                job_type, dict(count=0, seconds=0.0))
+            totals["count"] += 1
+            totals["seconds"] += seconds
+        return job_types
+
+    # (seconds, job type, job name) of the slowest jobs, slowest first
+    def slowest(self, count=10):
+        return sorted(
+            ((seconds, job_type, name)
+             for (job_type, name), seconds in self.jobs.items()),
+            reverse=True)[:count]
+
+    def as_dict(self):
+        return dict(
+            seconds=self.seconds,
+            phases=dict(self.phases),
+            job_types=self.job_types,
+            slowest=self.slowest(),
+            files=self.files_produced,
+            files_written=self.files_written,
+            bytes_written=self.bytes_written)
+
+
+def _job_type(job):
+    return getattr(job, "_type", None) or type(job).__name__
+
+
+def _job_name(job):
+    return getattr(job, "name", None) or job._file_name()
+
+
+# one summary line and the slowest jobs, through the standard logging
+class LoggingSink(object):
+
+    def __init__(self, logger=None, level=None, slowest=5):
+        import logging
+
+        self.logger = logger or logging.getLogger("auror_core.stats")
+        self.level = logging.INFO if level is None else level
+        self.slowest = slowest
+
+    def __call__(self, stats):
+        self.logger.log(
+            self.level,
+            "wrote %d of %d files (%d bytes) in %.3fs: %s",
+            stats.files_written,
+            stats.files_produced,
+            stats.bytes_written,
+            stats.seconds,
+            ", ".join(
+                "{} {:.3f}s".format(phase, stats.phases[phase])
+                for phase in PHASES))
+        for seconds, job_type, name in stats.slowest(self.slowest):
+            self.logger.log(
+                self.level, "slow job %s (%s) %.3fs", name, job_type, seconds)
+
+
+# StatsD lines over UDP, timers for the phases and job types and
+# counters for files and bytes. Sending is best effort, a missing
+# listener never fails the write
+class StatsdSink(object):
+
+    MAX_PACKET = 512
+
+    def __init__(self, host="127.0.0.1", port=8125, prefix="auror.write"):
+        self.address = host, port
+        self.prefix = prefix
+
+    def lines(self, stats):
+        lines = [self.__line("seconds", stats.seconds * 1000, "ms")]
+        lines.extend(
+            self.__line("phase." + phase, seconds * 1000, "ms")
+            for phase, seconds in sorted(stats.phases.items()))
+        lines.extend(
+            self.__line("job_type." + job_type, totals["seconds"] * 1000, "ms")
+            for job_type, totals in sorted(stats.job_types.items()))
+        lines.append(self.__line("files", stats.files_produced, "c"))
+        lines.append(self.__line("files_written", stats.files_written, "c"))
+        lines.append(self.__line("bytes", stats.bytes_written, "c"))
+        return lines
+
+    def __call__(self, stats):
+        import socket
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            for packet in self.__packets(self.lines(stats)):
+                sock.sendto(packet.encode("utf-8"), self.address)
+        except (socket.error, OSError):
+            pass
+        finally:
+            sock.close()
+
+    def __line(self, name, value, metric_type):
+        name = "{}.{}".format(self.prefix, name)
+        for character in ":|@ \n":
+            name = name.replace(character, "_")
+        if metric_type == "ms":
+            return "{}:{:.3f}|ms".format(name, value)
+        return "{}:{}|{}".format(name, value, metric_type)
+
+    def __packets(self, lines):
+        packet = []
+        for line in lines:
+            if packet and len("\n".join(packet + [line])) > self.MAX_PACKET:
+                yield "\n".join(packet)
+                packet = []
+            packet.append(line)
+        if packet:
+            yield "\n".join(packet)
@@ -0,0 +1,35 @@
+from auror_core.v1.job import Job, Command, Flow
+
+_custom_types = dict()
+
+
+# pickled by type name, the class is created again when it is loaded
+def _custom_job(job_type, name, dependencies, extra):
+    return JobType.get_job_type_class(job_type)(name, dependencies, extra)
+
+
+class _CustomJob(Job):
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return _custom_job, (
+            self._type, self.name, self.dependencies, self.extra)
+
+
+class JobType:
+    COMMAND = Command
+    FLOW = Flow
+
+    # plugin job types are not known here, loaded jobs of those types
+    # get a class of their own so they are written with the same type
+    @staticmethod
+    def get_job_type_class(job_type):
+        job_class = getattr(JobType, job_type.upper(), None)
+        if job_class is not None:
+            return job_class
+        if job_type not in _custom_types:
+            _custom_types[job_type] = type(
+                str(job_type[:1].upper() + job_type[1:]), (_CustomJob,),
+                dict(_type=job_type, __slots__=()))
+        return _custom_types[job_type]
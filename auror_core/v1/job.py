@@ -1,15 +1,18 @@
 import os
-import copy
-import javaproperties
 
+from auror_core.persistent import LazyProperties, freeze, freeze_names
+from auror_core.v1 import properties
 
-class Job(object):
+
+class Job(LazyProperties):
+
+    __slots__ = ("name", "dependencies", "extra")
 
     def __init__(self, name="DefaultJob", dependencies=None, extra=None):
         self.name = name
-        self.dependencies = dependencies or []
-        self.extra = extra or {}
-        self.properties = dict()
+        self.dependencies = freeze_names(dependencies)
+        self.extra = freeze(extra)
+        self._properties = None
 
     def instance(self, name, dependencies, extra):
         return self.__class__(name, dependencies, extra)
@@ -21,39 +24,80 @@ class Job(object):
         return self.instance(name, self.dependencies, self.extra)
 
     def with_dependencies(self, *dependencies):
-        dependencies = [dependency.name for dependency in dependencies]
+        dependencies = [
+            getattr(dependency, "name", dependency)
+            for dependency in dependencies
+        ]
         return self.instance(self.name, dependencies, self.extra)
 
     def with_(self, **extra):
-        self_extra = copy.deepcopy(self.extra)
-        self_extra.update(extra)
-        return self.instance(self.name, self.dependencies, self_extra)
+        return self.instance(
+            self.name, self.dependencies, self.extra.merge(extra))
+
+    # one job per row, the "name" and "dependencies" (names or jobs) of
+    # a row replace the template ones and any other key is added to
+    # extra, over the template extra that all the jobs share
+    def fan_out(self, rows):
+        jobs = []
+        given = names = self.dependencies
+        for row in rows:
+            row = dict(row)
+            name = row.pop("name")
+            # rows usually share one list, it is only resolved once
+            dependencies = row.pop("dependencies", self.dependencies)
+            if dependencies is not given:
+                given, names = dependencies, freeze_names([
+                    getattr(dependency, "name", dependency)
+                    for dependency in dependencies
+                ])
+            jobs.append(self.instance(name, names, self.extra.merge(row)))
+        return jobs
 
     # called on _add_items for custom types
     def before_add_hook(self):
         return self.instance(self.name, self.dependencies, self.extra)
 
+    def _file_name(self):
+        return "{}.job".format(self.name)
+
+    def _dumps(self, items=None):
+        if items is None:
+            items = self._all_properties()
+        return properties.dumps(items, self._file_name())
+
     def _write(self, folder):
-        name = "{}.job".format(self.name)
-        path = os.path.join(folder, name)
+        path = os.path.join(folder, self._file_name())
         with open(path, "w") as f:
-            javaproperties.dump(
-                self.properties,
-                f,
-                comments=name,
-                timestamp=False,
-                sort_keys=True)
+            f.write(self._dumps())
 
-    def _add_items(self):
+    def _get_properties(self):
         job = self.before_add_hook()
-        self.properties["type"] = job._type
-        for name, value in job.extra.items():
-            self.properties[name] = value
+        items = dict(type=job._type)
+        items.update(job.extra.items())
         if self.dependencies:
-            self.properties["dependencies"] = ",".join(job.dependencies)
+            items["dependencies"] = ",".join(job.dependencies)
+        return items
+
+    def _add_items(self):
+        self.properties.update(self._get_properties())
+
+    # the other way around, data holds the name and the loaded properties
+    @classmethod
+    def build(cls, data):
+        extra = dict(data["properties"])
+        extra.pop("type", None)
+        dependencies = [
+            name.strip()
+            for name in extra.pop("dependencies", "").split(",")
+            if name.strip()
+        ]
+        return cls(data["name"], dependencies, extra)
 
 
 class Command(Job):
+
+    __slots__ = ("_next_command_number",)
+
     _type = "command"
 
     def with_all_default(self):
@@ -63,14 +107,40 @@ class Command(Job):
         return self.with_(command=command)
 
     def with_another_command(self, command):
-        if not self.extra.get("command"):
-            return self.with_command(command)
-
-        counter = 1
-        while self.extra.get("command.{}".format(counter)):
+        return self.with_commands([command])
+
+    def with_commands(self, commands):
+        extra = dict()
+        next_number = self.__get_next_command_number()
+        for command in commands:
+            if not (extra.get("command") or self.extra.get("command")):
+                extra["command"] = command
+                continue
+
+            extra["command.{}".format(next_number)] = command
+            next_number = self.__get_free_command_number(next_number, extra)
+
+        job = self.with_(**extra)
+        job._next_command_number = next_number
+        return job
+
+    # the lowest free command number is cached on each job,
+    # numbers are only ever added so it never needs to go back
+    def __get_next_command_number(self):
+        if getattr(self, "_next_command_number", None) is None:
+            self._next_command_number = \
+                self.__get_free_command_number(1, dict())
+        return self._next_command_number
+
+    def __get_free_command_number(self, counter, extra):
+        while extra.get("command.{}".format(counter)) or \
+                self.extra.get("command.{}".format(counter)):
             counter += 1
-        return self.with_(**{"command.{}".format(counter): command})
+        return counter
 
 
 class Flow(Job):
+
+    __slots__ = ()
+
     _type = "flow"
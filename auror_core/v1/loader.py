@@ -0,0 +1,103 @@
+import io
+import multiprocessing
+import os
+
+from auror_core import Project
+from auror_core.graph import FlowGraph
+from auror_core.v1 import JobType, properties
+from auror_core.v1.params import Env, Params
+
+EXTENSIONS = (".job", ".properties")
+
+
+# java reads .job and .properties files as ISO-8859-1
+def load_file(path):
+    with io.open(path, encoding="iso-8859-1") as f:
+        return properties.loads(f.read())
+
+
+# .job and .properties files of a project, sorted by path
+def project_files(folder):
+    paths = []
+    for root, folders, names in os.walk(folder):
+        folders.sort()
+        paths.extend(
+            os.path.join(root, name) for name in sorted(names)
+            if name.endswith(EXTENSIONS))
+    return paths
+
+
+# (path, properties) of every file, run inside the workers
+def _parse_files(paths):
+    return [(path, load_file(path)) for path in paths]
+
+
+class Loader:
+    CHUNK_SIZE = 256
+
+    def __init__(self, folder, workers=None):
+        if not os.path.isdir(folder):
+            raise ValueError('Folder does not exists')
+
+        self.folder = folder
+        self.workers = workers
+        self.__files = None
+
+    def as_job_objects(self):
+        return [
+            JobType.get_job_type_class(
+                items.get("type", "command")).build(
+                    dict(name=name, properties=items))
+            for name, items in self.__parsed(".job")
+        ]
+
+    # files whose keys are all "env." come back as Env
+    def as_params(self):
+        params = []
+        for name, items in self.__parsed(".properties"):
+            if items and all(key.startswith("env.") for key in items):
+                param = Env(name)
+                param.key_vals = dict(
+                    (key[len("env."):], value)
+                    for key, value in items.items())
+            else:
+                param = Params(name)
+                param.key_vals = items
+            params.append(param)
+        return params
+
+    def as_flow(self):
+        return FlowGraph(self.as_job_objects())
+
+    # the folder as a v1 project, written back to the same folder
+    def as_project(self, folder=None):
+        return Project(folder or self.folder, *self.as_job_objects()) \
+            .is_v1().with_params(*self.as_params())
+
+    def __parsed(self, extension):
+        return [
+            (os.path.basename(path)[:-len(extension)], items)
+            for path, items in self.__load()
+            if path.endswith(extension)
+        ]
+
+    # every file is parsed once, by a pool of processes when
+    # there is more than one chunk of files to go through
+    def __load(self):
+        if self.__files is None:
+            paths = project_files(self.folder)
+            chunks = [
+                paths[start:start + self.CHUNK_SIZE]
+                for start in range(0, len(paths), self.CHUNK_SIZE)
+            ]
+            if self.workers == 1 or len(chunks) < 2:
+                parsed = [_parse_files(chunk) for chunk in chunks]
+            else:
+                pool = multiprocessing.Pool(self.workers)
+                try:
+                    parsed = pool.map(_parse_files, chunks)
+                finally:
+                    pool.close()
+                    pool.join()
+            self.__files = [item for chunk in parsed for item in chunk]
+        return self.__files
@@ -1,67 +1,84 @@
 import os
-import javaproperties
 
+from auror_core.persistent import LazyProperties
+from auror_core.v1 import properties
 
-class Params(object):
+
+class Params(LazyProperties):
+
+    __slots__ = ("name", "key_vals")
 
     def __init__(self, name="params", **key_vals):
         self.name = name
         self.key_vals = key_vals
-        self.properties = dict()
+        self._properties = None
 
     def _get_items(self):
         return list(self.key_vals.items())
 
+    def _get_properties(self):
+        return dict(self._get_items())
+
     def _add_items(self):
-        for name, value in self._get_items():
-            self.properties[name] = value
+        self.properties.update(self._get_properties())
+
+    def _file_name(self):
+        return "{}.properties".format(self.name)
+
+    def _dumps(self, items=None):
+        if items is None:
+            items = self._all_properties()
+        return properties.dumps(items, self._file_name())
 
     def _write(self, folder):
-        name = "{}.properties".format(self.name)
-        path = os.path.join(folder, name)
+        path = os.path.join(folder, self._file_name())
         with open(path, "w") as f:
-            javaproperties.dump(
-                self.properties,
-                f,
-                comments=name,
-                timestamp=False,
-                sort_keys=True)
+            f.write(self._dumps())
 
 
 class Env(Params):
 
+    __slots__ = ()
+
     def _get_items(self):
         return [("env.{}".format(name), value)
                 for name, value in self.key_vals.items()]
 
 
-class ParamsJoin:
+class ParamsJoin(LazyProperties):
+
+    __slots__ = ("param_name", "separator", "params_class")
 
     def __init__(self, param_name="custom.envs", separator=" "):
         self.param_name = param_name
         self.separator = separator
-        self.properties = dict()
         self.params_class = []
+        self._properties = None
 
     def __call__(self, *params_class):
         self.params_class = params_class
         return self
 
-    def _add_items(self):
+    def _get_properties(self):
         param_props = []
         for param_class in self.params_class:
             for name, value in param_class._get_items():
                 param_props.append(value)
-        self.properties[self.param_name] = self.separator.join(param_props)
+        return {self.param_name: self.separator.join(param_props)}
 
-    def _write(self, folder):
-        name = "{}.properties".format(
+    def _add_items(self):
+        self.properties.update(self._get_properties())
+
+    def _file_name(self):
+        return "{}.properties".format(
             "_".join([param_class.name for param_class in self.params_class]))
-        path = os.path.join(folder, name)
+
+    def _dumps(self, items=None):
+        if items is None:
+            items = self._all_properties()
+        return properties.dumps(items, self._file_name())
+
+    def _write(self, folder):
+        path = os.path.join(folder, self._file_name())
         with open(path, "w") as f:
-            javaproperties.dump(
-                self.properties,
-                f,
-                comments=name,
-                timestamp=False,
-                sort_keys=True)
+            f.write(self._dumps())
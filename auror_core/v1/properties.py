@@ -0,0 +1,111 @@
+import re
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+
+# same escaping as javaproperties (and java.util.Properties.store),
+# written for the plain text keys and values Auror produces
+ESCAPES = {
+    '\t': r'\t',
+    '\n': r'\n',
+    '\f': r'\f',
+    '\r': r'\r',
+    '!': r'\!',
+    '#': r'\#',
+    ':': r'\:',
+    '=': r'\=',
+    '\\': r'\\',
+}
+
+_SPECIAL = re.compile(r'[^\x20-\x7E]|[\\#!=:]')
+_LEADING_SPACES = re.compile(r'^ +')
+_COMMENT_SPECIAL = re.compile(r'[\r\n]|[^\x00-\xFF]')
+
+
+def _escape_character(match):
+    character = match.group()
+    if character in ESCAPES:
+        return ESCAPES[character]
+    code = ord(character)
+    if code > 0xFFFF:
+        code -= 0x10000
+        return '\\u{0:04x}\\u{1:04x}'.format(
+            0xD800 + (code >> 10), 0xDC00 + (code & 0x3FF))
+    return '\\u{0:04x}'.format(code)
+
+
+def _base_escape(field):
+    if _SPECIAL.search(field) is None:
+        return field
+    return _SPECIAL.sub(_escape_character, field)
+
+
+def escape_key(key):
+    return _base_escape(key).replace(' ', '\\ ')
+
+
+def escape_value(value):
+    value = _base_escape(value)
+    if value.startswith(' '):
+        return _LEADING_SPACES.sub(
+            lambda match: '\\ ' * match.end(), value)
+    return value
+
+
+def to_comment(comment):
+    if _COMMENT_SPECIAL.search(comment) is None:
+        return '#' + comment
+    comment = re.sub(r'\n(?![#!])', '\n#', re.sub(r'\r\n?', '\n', comment))
+    return '#' + re.sub(r'[^\x00-\xFF]', _escape_character, comment)
+
+
+# anything that is not text is left to javaproperties,
+# so errors and edge cases stay exactly the same
+def dumps(properties, comment):
+    items = sorted(properties.items())
+    if not all(isinstance(key, text_type) and isinstance(value, text_type)
+               for key, value in items) or \
+            not isinstance(comment, text_type):
+        import javaproperties
+        return javaproperties.dumps(
+            properties, comments=comment, timestamp=False, sort_keys=True)
+
+    lines = [to_comment(comment)]
+    keys = ''.join(key for key, _ in items)
+    values = ''.join(value for _, value in items)
+    # most files need no escaping at all, checked once for the whole file
+    if _SPECIAL.search(keys) is None and ' ' not in keys and \
+            _SPECIAL.search(values) is None and \
+            not any(value.startswith(' ') for _, value in items):
+        lines.extend(key + '=' + value for key, value in items)
+    else:
+        lines.extend(
+            escape_key(key) + '=' + escape_value(value)
+            for key, value in items)
+    lines.append('')
+    return '\n'.join(lines)
+
+
+_LINE_BREAK = re.compile(r'\r\n?|\n')
+_PLAIN_LINE = re.compile(
+    r'[ \t\f]*([^=: \t\f]*)[ \t\f]*[=:]?[ \t\f]*(.*)', re.DOTALL)
+
+
+# files without a backslash have no escapes nor continuation lines,
+# the rest is parsed by javaproperties like dumps does
+def loads(text):
+    if '\\' in text:
+        import javaproperties
+        return javaproperties.loads(text)
+
+    items = dict()
+    for line in _LINE_BREAK.split(text):
+        line = line.lstrip(' \t\f')
+        if not line or line[0] in '#!':
+            continue
+        key, value = _PLAIN_LINE.match(line).groups()
+        items[key] = value
+    return items
@@ -1,9 +1,39 @@
 from auror_core.v2.job import Command
 
+_custom_types = dict()
+
+
+# pickled by type name, the class is created again when it is loaded
+def _custom_job(job_type, name, config, dependencies, nodes, extra):
+    return JobType.get_job_type_class(job_type)(
+        name, config, dependencies, nodes, extra)
+
+
+class _CustomCommand(Command):
+
+    __slots__ = ()
+
+    # the generated classes can not be imported, dumped flows use Command
+    _dump_class = Command
+
+    def __reduce__(self):
+        return _custom_job, (
+            self._type, self.name, self.config, self.dependencies,
+            self.nodes, self.extra)
+
 
 class JobType:
     COMMAND = Command
 
+    # other types are built as commands that keep the type
+    # they were loaded with, so they are written back the same
     @staticmethod
     def get_job_type_class(job_type):
-        return getattr(JobType, job_type.upper(), Command)
+        job_class = getattr(JobType, job_type.upper(), None)
+        if job_class is not None:
+            return job_class
+        if job_type not in _custom_types:
+            _custom_types[job_type] = type(
+                str(job_type[:1].upper() + job_type[1:]), (_CustomCommand,),
+                dict(_type=job_type, __slots__=()))
+        return _custom_types[job_type]
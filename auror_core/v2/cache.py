@@ -0,0 +1,118 @@
+import hashlib
+import os
+import pickle
+import uuid
+
+_replace = getattr(os, "replace", os.rename)
+
+
+# built jobs of .flow files kept on disk between runs, an entry is used
+# while the file keeps its size and mtime or, after a checkout that only
+# touched the mtime, its content hash. Entries are pickles, so the
+# directory must only be writable by whoever runs the Loader
+class FlowCache(object):
+
+    VERSION = 1
+
+    def __init__(self, directory, max_entries=256):
+        self.directory = directory
+        self.max_entries = max_entries
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def get_or_build(self, path, build):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self.__entry_path(path)
+        header = self.__read_header(entry)
+        size, mtime = stat.st_size, getattr(stat, "st_mtime_ns", stat.st_mtime)
+
+        if header and header["size"] == size and header["mtime"] == mtime:
+            payload = self.__read_payload(entry)
+            if payload is not None:
+                os.utime(entry, None)
+                return payload
+
+        digest = self.__digest(path)
+        if header and header["size"] == size and header["digest"] == digest:
+            payload = self.__read_payload(entry)
+            if payload is not None:
+                self.__store(entry, dict(header, mtime=mtime), payload)
+                return payload
+
+        payload = build()
+        self.__store(
+            entry, dict(size=size, mtime=mtime, digest=digest), payload)
+        self.__evict()
+        return payload
+
+    def clear(self):
+        for name in self.__entries():
+            os.remove(os.path.join(self.directory, name))
+
+    def __entry_path(self, path):
+        key = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "{}.flowcache".format(key))
+
+    def __entries(self):
+        return [
+            name for name in os.listdir(self.directory)
+            if name.endswith(".flowcache")
+        ]
+
+    @staticmethod
+    def __digest(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    # the header is a pickle of its own, checking an entry never loads
+    # the jobs stored after it. A broken header is a miss, whatever
+    # the error it raises
+    def __read_header(self, entry):
+        try:
+            with open(entry, "rb") as f:
+                header = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(header, dict) or \
+                header.get("version") != self.VERSION or \
+                not all(key in header for key in ("size", "mtime", "digest")):
+            return None
+        return header
+
+    @staticmethod
+    def __read_payload(entry):
+        try:
+            with open(entry, "rb") as f:
+                pickle.load(f)
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def __store(self, entry, header, payload):
+        header["version"] = self.VERSION
+        temporary = "{}.{}.tmp".format(entry, uuid.uuid4().hex)
+        try:
+            with open(temporary, "wb") as f:
+                pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(payload, f, pickle.HIGHEST_PROTOCOL)
+            _replace(temporary, entry)
+        except Exception:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    # least recently used entries go first, a hit refreshes the entry mtime
+    def __evict(self):
+        entries = self.__entries()
+        if len(entries) <= self.max_entries:
+            return
+        paths = [os.path.join(self.directory, name) for name in entries]
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,53 @@
+import os
+
+from auror_core.v1 import JobType
+from auror_core.v1.loader import load_file, project_files
+from auror_core.writer import WriteReport
+
+PROJECT_FILE = "flow20.project"
+
+
+def _node(name, items):
+    job = JobType.get_job_type_class(items.get("type", "command")).build(
+        dict(name=name, properties=items))
+    node = dict(
+        name=job.name, type=job._type, config=job.extra.as_dict(), nodes=[])
+    if job.dependencies:
+        node["dependsOn"] = list(job.dependencies)
+    return node
+
+
+# a v1 project folder as the .flow file Project(...).is_v2() would write,
+# params and env are folded into the flow config (later files win) and
+# every job is read, dumped and dropped before the next one is read
+def convert(source, destination):
+    from auror_core.v2 import yaml_backend
+
+    if not os.path.isdir(source):
+        raise ValueError('Folder does not exists')
+    if not os.path.isdir(destination):
+        os.makedirs(destination)
+
+    paths = project_files(source)
+    config = None
+    for path in paths:
+        if path.endswith(".properties"):
+            config = config or dict()
+            config.update(load_file(path))
+
+    flow_name = "{}.flow".format(os.path.basename(destination))
+    with open(os.path.join(destination, flow_name), "w") as f:
+        if config is not None:
+            yaml_backend.dump(dict(config=config), f)
+        jobs = (path for path in paths if path.endswith(".job"))
+        for number, path in enumerate(jobs):
+            if not number:
+                f.write("nodes:\n")
+            name = os.path.basename(path)[:-len(".job")]
+            yaml_backend.dump([_node(name, load_file(path))], f)
+        if not f.tell():
+            yaml_backend.dump(dict(), f)
+
+    with open(os.path.join(destination, PROJECT_FILE), "w") as f:
+        f.write("azkaban-flow-version: 2.0")
+    return WriteReport([flow_name, PROJECT_FILE], [], [])
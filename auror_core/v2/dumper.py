@@ -1,29 +1,317 @@
+import keyword
 import os
+import re
 
-import autopep8
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
+
+from collections import Counter, namedtuple
+
+from auror_core.v2.job import Job
+
+
+_Call = namedtuple('_Call', ['name', 'arguments'])
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+# the class a job is dumped as, loaded plugin types are dumped as Command
+def _job_class(job):
+    return getattr(type(job), '_dump_class', None) or type(job)
+
+
+class _Reference(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+# prints jobs as constructor calls already laid out as PEP 8 code,
+# anything that does not fit in a line is split one item per line
+class Emitter(object):
+
+    MAX_LINE_LENGTH = 79
+    INDENT = 4
+    JOB_ARGUMENTS = ('name', 'config', 'dependencies', 'nodes', 'extra')
+
+    def emit(self, name, value):
+        prefix = '{} = '.format(name)
+        return prefix + self.__pretty(value, len(prefix), 0, 0)
+
+    # head.link().link() written on one line or split with backslashes
+    def emit_chain(self, name, head, links):
+        prefix = '{} = '.format(name)
+        flat = self.__flat_chain(
+            [head] + list(links), self.MAX_LINE_LENGTH - len(prefix))
+        if flat is not None:
+            return prefix + flat
+
+        lines = [prefix + self.__pretty(head, len(prefix), 0, 2)]
+        for index, link in enumerate(links):
+            trailing = 2 if index < len(links) - 1 else 0
+            lines.append(' ' * self.INDENT + self.__pretty(
+                link, self.INDENT, self.INDENT, trailing))
+        return ' \\\n'.join(lines)
+
+    def emit_imports(self, jobs):
+        modules = dict()
+        pending = list(jobs)
+        while pending:
+            job = pending.pop()
+            job_type = _job_class(job)
+            modules.setdefault(job_type.__module__, set()).add(
+                job_type.__name__)
+            pending.extend(
+                node for node in job.nodes if isinstance(node, Job))
+        return ''.join(
+            'from {} import {}\n'.format(module, ', '.join(sorted(names)))
+            for module, names in sorted(modules.items()))
+
+    @staticmethod
+    def keyword_arguments(items):
+        if all(isinstance(key, str) and _IDENTIFIER.match(key) and
+               not keyword.iskeyword(key) and key != 'self'
+               for key in items):
+            return [('{}='.format(key), value) for key, value in items.items()]
+        return [('**', dict(items))]
+
+    def __flat_chain(self, chain, budget):
+        flat = ''
+        for value in chain:
+            value_flat = self.__flat(value, budget - len(flat))
+            if value_flat is None:
+                return None
+            flat += value_flat
+        return flat
+
+    # one line version of the value, None when it is longer than budget
+    def __flat(self, value, budget):
+        items = self.__items(value)
+        if items is None:
+            flat = repr(value)
+            return flat if len(flat) <= budget else None
+
+        opening, closing, items = items
+        flat = opening
+        for index, (prefix, item) in enumerate(items):
+            separator = ', ' if index else ''
+            item_budget = budget - len(flat) - len(separator) - \
+                len(prefix) - len(closing)
+            item_flat = self.__flat(item, item_budget)
+            if item_flat is None:
+                return None
+            flat += separator + prefix + item_flat
+        return flat + closing if len(flat) + len(closing) <= budget else None
+
+    def __items(self, value):
+        if isinstance(value, _Call):
+            if [prefix for prefix, _ in value.arguments] == ['**']:
+                return '{}(**{{'.format(value.name), '})', [
+                    ('{}: '.format(repr(key)), item)
+                    for key, item in value.arguments[0][1].items()
+                ]
+            return '{}('.format(value.name), ')', value.arguments
+        if isinstance(value, Job):
+            return '{}('.format(_job_class(value).__name__), ')', [
+                ('{}='.format(argument), getattr(value, argument))
+                for argument in self.JOB_ARGUMENTS
+            ]
+        if isinstance(value, Mapping):
+            return '{', '}', [
+                ('{}: '.format(repr(key)), item)
+                for key, item in value.items()
+            ]
+        if isinstance(value, Sequence) and not self.__is_text(value):
+            return '[', ']', [('', item) for item in value]
+        return None
+
+    def __pretty(self, value, column, indent, trailing):
+        flat = self.__flat(value, self.MAX_LINE_LENGTH - column - trailing)
+        if flat is not None:
+            return flat
+
+        items = self.__items(value)
+        if items is None or not items[2]:
+            if self.__is_text(value) and len(value) > 1:
+                return self.__split_text(value, indent)
+            return repr(value) if items is None else items[0] + items[1]
+
+        opening, closing, items = items
+        inner = indent + self.INDENT
+        lines = [opening]
+        for prefix, item in items:
+            lines.append('{}{}{},'.format(
+                ' ' * inner,
+                prefix,
+                self.__pretty(item, inner + len(prefix), inner, 1)))
+        lines.append(' ' * indent + closing)
+        return '\n'.join(lines)
+
+    # long strings become implicitly concatenated chunks inside parentheses
+    def __split_text(self, value, indent):
+        inner = indent + self.INDENT
+        width = max(self.MAX_LINE_LENGTH - inner, 10)
+        chunks = []
+        chunk = value[:0]
+        for character in value:
+            if chunk and len(repr(chunk + character)) > width:
+                split = chunk.rfind(' ') + 1 or len(chunk)
+                chunks.append(chunk[:split])
+                chunk = chunk[split:]
+            chunk += character
+        chunks.append(chunk)
+
+        lines = ['(']
+        lines.extend(' ' * inner + repr(chunk) for chunk in chunks)
+        lines.append(' ' * indent + ')')
+        return '\n'.join(lines)
+
+    @staticmethod
+    def __is_text(value):
+        return isinstance(value, (type(u''), type(b''), type('')))
+
+
+# finds the config items shared by two or more jobs of the same type,
+# every group of jobs sharing the same items gets one base template
+class SharedBases(object):
+
+    def __init__(self, jobs):
+        self.bases = []
+        self.__job_bases = dict()
+        by_type = dict()
+        for job in jobs:
+            by_type.setdefault(_job_class(job), []).append(job)
+        for job_type, typed_jobs in by_type.items():
+            self.__find_bases(job_type, typed_jobs)
+
+    @staticmethod
+    def config(job):
+        config = dict(job.config)
+        config.update(job.extra)
+        return config
+
+    def base_of(self, job):
+        return self.__job_bases.get(id(job))
+
+    def __find_bases(self, job_type, jobs):
+        configs = [self.config(job) for job in jobs]
+        counts = Counter(
+            pair for config in configs for pair in self.__pairs(config))
+        signatures = [
+            frozenset(
+                pair for pair in self.__pairs(config) if counts[pair] > 1)
+            for config in configs
+        ]
+
+        signature_counts = Counter(signatures)
+        bases = dict()
+        for config, signature in zip(configs, signatures):
+            if signature and signature_counts[signature] > 1 and \
+                    signature not in bases:
+                bases[signature] = len(self.bases)
+                self.bases.append((job_type, dict(
+                    (key, value) for key, value in config.items()
+                    if (key, repr(value)) in signature)))
+
+        for job, signature in zip(jobs, signatures):
+            candidates = [
+                (len(base), -number) for base, number in bases.items()
+                if base <= signature
+            ]
+            if candidates:
+                self.__job_bases[id(job)] = -max(candidates)[1]
+
+    @staticmethod
+    def __pairs(config):
+        return [(key, repr(value)) for key, value in config.items()]
 
 
 class Dumper:
 
     DEFAULT_IMPORTS = 'from auror_core.v2.job import Command\n\n\n'
 
-    def __init__(self, path):
+    def __init__(self, path, share_bases=False):
         if not os.path.exists(path):
             raise ValueError('Directory, {}, does not exist'.format(path))
         self.path = path
+        self.share_bases = share_bases
+        self.emitter = Emitter()
+
+    def dumps_jobs(self, *jobs):
+        imports = self.DEFAULT_IMPORTS
+        if jobs:
+            imports = '{}\n\n'.format(self.emitter.emit_imports(jobs))
+        if self.share_bases:
+            return imports + self.__lines(self.__with_bases(jobs))
+        return imports + self.__lines(
+            self.emitter.emit('job_{}'.format(job_number), job)
+            for job_number, job in enumerate(jobs))
 
     def dump_jobs(self, *jobs):
         _path = '{}/flow.py'.format(self.path)
         with open(_path, 'w') as _file:
-            _file.write(self.DEFAULT_IMPORTS)
-            for job_number, job in enumerate(jobs):
-                _file.write('job_{} = {}\n\n'.format(job_number, repr(job)))
-        self.__format_file(_path)
-
-    def __format_file(self, path):
-        autopep8.fix_file(
-            path,
-            options=autopep8.parse_args(
-                ['--in-place', '--aggressive', path]
-            )
-        )
+            _file.write(self.dumps_jobs(*jobs))
+
+    @staticmethod
+    def __lines(statements):
+        return ''.join(
+            '{}{}\n'.format('\n' if number else '', statement)
+            for number, statement in enumerate(statements))
+
+    def __with_bases(self, jobs):
+        ordered = []
+        names = dict()
+        for job_number, job in enumerate(jobs):
+            self.__order(job, 'job_{}'.format(job_number), names, ordered)
+
+        shared = SharedBases(job for job, _ in ordered)
+        for base_number, (job_type, config) in enumerate(shared.bases):
+            yield self.emitter.emit_chain(
+                'base_{}'.format(base_number),
+                _Call(job_type.__name__, []),
+                [_Call('.with_', self.emitter.keyword_arguments(config))])
+        for job, name in ordered:
+            yield self.__derived(job, name, names, shared)
+
+    # nested nodes come before the jobs using them, a job object used
+    # more than once is only written once
+    def __order(self, job, name, names, ordered):
+        if id(job) in names:
+            return
+        for node_number, node in enumerate(job.nodes):
+            self.__order(
+                node, '{}_{}'.format(name, node_number), names, ordered)
+        names[id(job)] = name
+        ordered.append((job, name))
+
+    def __derived(self, job, name, names, shared):
+        nodes = [_Reference(names[id(node)]) for node in job.nodes]
+        base = shared.base_of(job)
+        if base is None:
+            return self.emitter.emit(name, _Call(_job_class(job).__name__, [
+                ('name=', job.name),
+                ('config=', dict(job.config)),
+                ('dependencies=', list(job.dependencies)),
+                ('nodes=', nodes),
+                ('extra=', dict(job.extra)),
+            ]))
+
+        _, base_config = shared.bases[base]
+        links = [_Call('.with_name', [('', job.name)])]
+        if job.dependencies:
+            links.append(_Call('.with_dependencies', [
+                ('', dependency) for dependency in job.dependencies]))
+        if nodes:
+            links.append(_Call('.with_nodes', [('', node) for node in nodes]))
+        extra = dict(
+            (key, value) for key, value in shared.config(job).items()
+            if key not in base_config)
+        if extra:
+            links.append(
+                _Call('.with_', self.emitter.keyword_arguments(extra)))
+        return self.emitter.emit_chain(
+            name, _Reference('base_{}'.format(base)), links)
@@ -1,13 +1,14 @@
 import os
-import copy
-
-import yaml
 
 from collections import namedtuple
-from functools import reduce
 
+from auror_core.persistent import LazyProperties, freeze, freeze_names
+from auror_core.v2.serializer import FlowSerializer
+
+
+class Job(LazyProperties):
 
-class Job(object):
+    __slots__ = ("name", "config", "dependencies", "nodes", "extra")
 
     def __init__(
             self,
@@ -17,11 +18,11 @@ class Job(object):
             nodes=None,
             extra=None):
         self.name = name
-        self.config = config or {}
-        self.dependencies = dependencies or []
+        self.config = freeze(config)
+        self.dependencies = freeze_names(dependencies)
         self.nodes = nodes or []
-        self.extra = extra or {}
-        self.properties = dict(nodes=list())
+        self.extra = freeze(extra)
+        self._properties = None
 
     def __eq__(self, other):
         return (isinstance(other, Job)) and \
@@ -30,7 +31,7 @@ class Job(object):
             self.dependencies == other.dependencies and \
             self.nodes == other.nodes and \
             self.extra == other.extra and \
-            self.properties == other.properties
+            self._current_properties() == other._current_properties()
 
     def __repr__(self):
         return "{}(name='{}', config={}, dependencies={}, nodes={}, extra={})"\
@@ -43,6 +44,9 @@ class Job(object):
                 self.extra,
             )
 
+    def _new_properties(self):
+        return dict(nodes=list())
+
     def instance(self, name, config, dependencies, nodes, extra):
         return self.__class__(name, config, dependencies, nodes, extra)
 
@@ -64,14 +68,17 @@ class Job(object):
 
     def with_config(self, config):
         return self.instance(
-            name,
-            self.config,
+            self.name,
+            config,
             self.dependencies,
             self.nodes,
             self.extra)
 
     def with_dependencies(self, *dependencies):
-        dependencies = [dependency.name for dependency in dependencies]
+        dependencies = [
+            getattr(dependency, "name", dependency)
+            for dependency in dependencies
+        ]
         return self.instance(
             self.name,
             self.config,
@@ -88,14 +95,36 @@ class Job(object):
             self.extra)
 
     def with_(self, **extra):
-        self_extra = copy.deepcopy(self.extra)
-        self_extra.update(extra)
         return self.instance(
             self.name,
             self.config,
             self.dependencies,
             self.nodes,
-            self_extra)
+            self.extra.merge(extra))
+
+    # one job per row, the "name" and "dependencies" (names or jobs) of
+    # a row replace the template ones and any other key is added to
+    # extra, over the template config and extra that all the jobs share
+    def fan_out(self, rows):
+        jobs = []
+        given = names = self.dependencies
+        for row in rows:
+            row = dict(row)
+            name = row.pop("name")
+            # rows usually share one list, it is only resolved once
+            dependencies = row.pop("dependencies", self.dependencies)
+            if dependencies is not given:
+                given, names = dependencies, freeze_names([
+                    getattr(dependency, "name", dependency)
+                    for dependency in dependencies
+                ])
+            jobs.append(self.instance(
+                name,
+                self.config,
+                names,
+                self.nodes,
+                self.extra.merge(row)))
+        return jobs
 
     # called on _add_items for custom types
     def before_add_hook(self):
@@ -107,33 +136,21 @@ class Job(object):
             self.extra)
 
     def _write(self, folder):
+        from auror_core.v2 import yaml_backend
+
         name = os.path.basename(folder)
         path = "{}.flow".format(os.path.join(folder, name))
         try:
             with open(path, 'rb') as reader:
-                data = yaml.load(reader)
+                data = yaml_backend.load(reader)
             data.update(self.properties)
         except IOError:
             data = self.properties
         with open(path, 'w') as writer:
-            writer.write(
-                yaml.dump(data, default_flow_style=False)
-            )
-
-    def _get_subnodes(self, job):
-        return [node.properties["nodes"] for node in job.nodes]
+            yaml_backend.dump(data, writer)
 
     def _get_node(self, job):
-        node_dict = dict()
-        node_dict["name"] = job.name
-        node_dict["type"] = job._type
-        node_dict["config"] = job.config
-        node_dict["nodes"] = self._get_subnodes(job)
-        for name, value in job.extra.items():
-            node_dict["config"][name] = value
-        if job.dependencies:
-            node_dict["dependsOn"] = job.dependencies
-        return node_dict
+        return FlowSerializer.active().node_of(job)
 
     def _add_items(self):
         job = self.before_add_hook()
@@ -145,6 +162,9 @@ class Job(object):
 
 
 class Command(Job):
+
+    __slots__ = ("_next_command_number",)
+
     _type = "command"
     _Command = namedtuple('_Command', ['command', 'command_number'])
 
@@ -163,26 +183,50 @@ class Command(Job):
     def with_command(self, command):
         return self.with_(command=command)
 
-    def with_another_commands(self, commands):
-        return reduce(
-            lambda instance, command: instance.with_another_command(*command),
-            commands,
-            self
-        )
+    def with_commands(self, commands):
+        return self.with_another_commands(
+            self._Command(command, None) for command in commands)
 
-    def with_another_command(self, command, command_number=None):
-        if not command:
+    def with_another_commands(self, commands):
+        extra = dict()
+        next_number = self.__get_next_command_number()
+        for command in commands:
+            command, command_number = self.__unpack_command(*command)
+            if not command:
+                continue
+
+            if not (extra.get("command") or self.extra.get("command")):
+                extra["command"] = command
+                continue
+
+            command_number = command_number or next_number
+            extra["command.{}".format(command_number)] = command
+            next_number = self.__get_free_command_number(next_number, extra)
+
+        if not extra:
             return self
+        job = self.with_(**extra)
+        job._next_command_number = next_number
+        return job
 
-        if not self.extra.get("command"):
-            return self.with_command(command)
+    def with_another_command(self, command, command_number=None):
+        return self.with_another_commands([(command, command_number)])
 
-        command_number = command_number or self.__get_next_command_number()
-        return self.with_(**{"command.{}".format(command_number): command})
+    @staticmethod
+    def __unpack_command(command, command_number=None):
+        return command, command_number
 
+    # the lowest free command number is cached on each job,
+    # numbers are only ever added so it never needs to go back
     def __get_next_command_number(self):
-        counter = 1
-        while self.extra.get("command.{}".format(counter)):
+        if getattr(self, "_next_command_number", None) is None:
+            self._next_command_number = \
+                self.__get_free_command_number(1, dict())
+        return self._next_command_number
+
+    def __get_free_command_number(self, counter, extra):
+        while extra.get("command.{}".format(counter)) or \
+                self.extra.get("command.{}".format(counter)):
             counter += 1
         return counter
 
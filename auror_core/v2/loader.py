@@ -1,35 +1,118 @@
 import os
 
-import yaml
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
 
+from auror_core.graph import FlowGraph
 from auror_core.v2.job import Job
-from auror_core.v2.dumper import Dumper
 from auror_core.v2 import JobType
 
 
+class LazyJobs(Sequence):
+
+    def __init__(self, jobs, build_job):
+        self.__jobs = jobs
+        self.__build_job = build_job
+        self.__built = None
+
+    def __built_jobs(self):
+        if self.__built is None:
+            self.__built = [self.__build_job(job) for job in self.__jobs]
+            self.__jobs = None
+        return self.__built
+
+    def is_built(self):
+        return self.__built is not None
+
+    def __getitem__(self, index):
+        return self.__built_jobs()[index]
+
+    def __len__(self):
+        if self.__built is None:
+            return len(self.__jobs)
+        return len(self.__built)
+
+    def __eq__(self, other):
+        return isinstance(other, (list, LazyJobs)) and \
+            self.__built_jobs() == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.__built_jobs())
+
+
 class Loader:
-    def __init__(self, flow_file_path):
+    def __init__(self, flow_file_path, cache=None):
         if not os.path.exists(flow_file_path):
             raise ValueError('File does not exists')
 
-        self._config, self._jobs = self.__load_yaml(flow_file_path)
+        self.flow_file_path = flow_file_path
+        self.cache = cache
+        self.__yaml = None
 
-    def __load_yaml(self, path):
-        yaml_file = yaml.safe_load(open(path))
-        config = yaml_file['config'] if 'config' in yaml_file.keys() else {}
-        return config, yaml_file['nodes']
+    @property
+    def _config(self):
+        return self.__load_yaml()[0]
+
+    @property
+    def _jobs(self):
+        return self.__load_yaml()[1]
+
+    # yaml is only imported once a flow is actually read
+    def __load_yaml(self):
+        if self.__yaml is None:
+            from auror_core.v2 import yaml_backend
+
+            with open(self.flow_file_path) as stream:
+                yaml_file = yaml_backend.load(stream)
+            config = yaml_file['config'] \
+                if 'config' in yaml_file.keys() else {}
+            self.__yaml = config, yaml_file['nodes']
+        return self.__yaml
 
     def as_job_objects(self):
+        if self.cache is not None:
+            return self.cache.get_or_build(
+                self.flow_file_path,
+                lambda: self.__as_job_objects(self._jobs))
         return self.__as_job_objects(self._jobs)
 
+    # jobs indexed by name, type and dependents, nested nodes included
+    def as_flow(self):
+        return FlowGraph(self.as_job_objects())
+
+    # top-level jobs are parsed and built one at a time,
+    # nested nodes are only built when they are accessed
+    def iter_job_objects(self):
+        from auror_core.v2 import yaml_backend
+
+        with open(self.flow_file_path) as stream:
+            for job in yaml_backend.iter_items(stream, 'nodes'):
+                yield self.__build_lazy_job(job)
+
     def __as_job_objects(self, jobs):
         return [self.__build_job(job) for job in jobs]
 
+    # the parsed yaml is kept for the next build, nodes are built
+    # into a copy of the job instead of replacing the parsed ones
     def __build_job(self, job):
         if job.get('nodes'):
-            job['nodes'] = self.__as_job_objects(job.get('nodes'))
+            job = dict(job, nodes=self.__as_job_objects(job['nodes']))
         return JobType.get_job_type_class(job.get('type')).build(job)
 
-    def as_python_file(self, directory):
-        dumper = Dumper(directory)
+    def __build_lazy_job(self, job):
+        if job.get('nodes'):
+            job['nodes'] = LazyJobs(job.get('nodes'), self.__build_lazy_job)
+        return JobType.get_job_type_class(job.get('type')).build(job)
+
+    def as_python_file(self, directory, share_bases=False):
+        from auror_core.v2.dumper import Dumper
+
+        dumper = Dumper(directory, share_bases)
         dumper.dump_jobs(*self.as_job_objects())
@@ -1,38 +1,50 @@
 import os
-import yaml
 
+from auror_core.persistent import LazyProperties
 
-class Params(object):
+
+class Params(LazyProperties):
+
+    __slots__ = ("name", "key_vals")
 
     def __init__(self, name="params", **key_vals):
         self.name = name
         self.key_vals = key_vals
-        self.properties = dict(config=dict())
+        self._properties = None
+
+    def _new_properties(self):
+        return dict(config=dict())
 
     def _get_items(self):
         return list(self.key_vals.items())
 
+    def _get_config(self):
+        return dict(self._get_items())
+
     def _add_items(self):
-        self.properties['config'] = dict(self._get_items())
+        self.properties['config'] = self._get_config()
 
     def _write(self, folder):
+        from auror_core.v2 import yaml_backend
+
         name = os.path.basename(folder)
         path = "{}.flow".format(os.path.join(folder, name))
         try:
             with open(path, 'rb') as reader:
-                data = yaml.load(reader)
-            data.update(self.properties)
+                data = yaml_backend.load(reader)
         except IOError:
-            data = self.properties
+            data = dict()
+        # the config already in the flow is kept, only these keys change
+        data["config"] = merge_config([data.get("config") or dict(), self])
 
         with open(path, 'w') as writer:
-            writer.write(
-                yaml.dump(data, default_flow_style=False)
-            )
+            yaml_backend.dump(data, writer)
 
 
 class Env(Params):
 
+    __slots__ = ()
+
     def _get_items(self):
         return [("env.{}".format(name), value)
                 for name, value in self.key_vals.items()]
@@ -40,20 +52,35 @@ class Env(Params):
 
 class ParamsJoin(Params):
 
+    __slots__ = ("param_name", "separator", "params_class")
+
     def __init__(self, param_name="custom.envs", separator=" "):
         self.param_name = param_name
         self.separator = separator
-        self.properties = dict(config=dict())
         self.params_class = []
+        self._properties = None
 
     def __call__(self, *params_class):
         self.params_class = params_class
         return self
 
-    def _add_items(self):
+    def _get_config(self):
         param_props = []
         for param_class in self.params_class:
             for name, value in param_class._get_items():
                 param_props.append(value)
-        self.properties["config"][self.param_name] = self.separator.join(
-            param_props)
+        return {self.param_name: self.separator.join(param_props)}
+
+    def _add_items(self):
+        self.properties["config"].update(self._get_config())
+
+
+# the flow config of many params, merged in a single pass: params are
+# applied in the given order and a key set by more than one keeps the
+# value of the last, plain dicts are taken as they are
+def merge_config(params):
+    config = dict()
+    for param in params:
+        config.update(
+            param if isinstance(param, dict) else param._get_config())
+    return config
@@ -0,0 +1,96 @@
+import threading
+
+from auror_core.stats import NO_STATS
+from auror_core.v2.params import merge_config
+
+_active = threading.local()
+
+
+class FlowSerializer(object):
+
+    def __init__(self, stats=NO_STATS):
+        self.stats = stats
+        self.config = None
+        self.nodes = list()
+        self.__nodes = dict()
+
+    def add_params(self, *params):
+        if params:
+            self.config = merge_config([self.config or dict()] + list(params))
+        return self
+
+    def add_jobs(self, *jobs):
+        self.nodes.extend(self.node(job) for job in jobs)
+        return self
+
+    # each job object is serialized once, a sub-flow reused by
+    # several parents shares its node, jobs are never changed. Nested
+    # jobs are built first from an explicit stack, so when a job builds
+    # its node its children are all cached and _get_node overrides do
+    # not add frames per level. Validation and the yaml dump still
+    # recurse, the nesting a flow can have is bounded by them
+    def node(self, job):
+        hooked_jobs = dict()
+        stack = [job]
+        while stack:
+            current = stack[-1]
+            if id(current) in self.__nodes:
+                stack.pop()
+                continue
+            hooked = hooked_jobs.get(id(current))
+            if hooked is None:
+                with self.stats.time("prepare", current):
+                    hooked = current.before_add_hook()
+                hooked_jobs[id(current)] = hooked
+                pending = [
+                    child for child in hooked.nodes
+                    if id(child) not in self.__nodes
+                ]
+                if pending:
+                    stack.extend(reversed(pending))
+                    continue
+            stack.pop()
+            self.__nodes[id(current)] = \
+                current, self.__get_node(current, hooked)
+        return self.__nodes[id(job)][1]
+
+    # the node comes from the job, so plugin types can change it,
+    # Job._get_node hands the nested nodes back to this serializer
+    def __get_node(self, job, hooked):
+        previous = getattr(_active, "serializer", None)
+        _active.serializer = self
+        try:
+            return job._get_node(hooked)
+        finally:
+            _active.serializer = previous
+
+    # the serializer building nodes on this thread, if any
+    @staticmethod
+    def active():
+        return getattr(_active, "serializer", None) or FlowSerializer()
+
+    # the node of a job that already went through before_add_hook
+    def node_of(self, job):
+        config = dict(job.config)
+        config.update(job.extra)
+        node = dict(
+            name=job.name,
+            type=job._type,
+            config=config,
+            nodes=[self.node(child) for child in job.nodes])
+        if job.dependencies:
+            node["dependsOn"] = list(job.dependencies)
+        return node
+
+    def as_dict(self):
+        data = dict()
+        if self.config is not None:
+            data["config"] = self.config
+        if self.nodes:
+            data["nodes"] = self.nodes
+        return data
+
+    def dumps(self):
+        from auror_core.v2 import yaml_backend
+
+        return yaml_backend.dump(self.as_dict())
@@ -0,0 +1,67 @@
+import yaml
+
+from yaml.composer import Composer
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    BACKEND = "libyaml"
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    BACKEND = "python"
+
+
+# composes one node at a time straight from the event stream,
+# so a document never needs to be fully held in memory
+class StreamLoader(SafeLoader, Composer):
+
+    def __init__(self, stream):
+        SafeLoader.__init__(self, stream)
+        Composer.__init__(self)
+
+    def next_object(self):
+        return self.construct_document(self.compose_node(None, None))
+
+    def skip_object(self):
+        self.compose_node(None, None)
+
+
+# nodes shared by several flows are written in full, never as aliases
+class Dumper(SafeDumper):
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def load(stream):
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data, stream=None):
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=Dumper,
+        default_flow_style=False)
+
+
+def iter_items(stream, key):
+    loader = StreamLoader(stream)
+    try:
+        loader.get_event()
+        if not loader.check_event(yaml.DocumentStartEvent):
+            return
+        loader.get_event()
+        if not loader.check_event(yaml.MappingStartEvent):
+            return
+        loader.get_event()
+        while not loader.check_event(yaml.MappingEndEvent):
+            if loader.next_object() != key or \
+                    not loader.check_event(yaml.SequenceStartEvent):
+                loader.skip_object()
+                continue
+            loader.get_event()
+            while not loader.check_event(yaml.SequenceEndEvent):
+                yield loader.next_object()
+            loader.get_event()
+    finally:
+        loader.dispose()
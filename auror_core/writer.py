@@ -0,0 +1,198 @@
+import os
+import threading
+
+from collections import namedtuple
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+
+MANIFEST_NAME = ".auror_manifest"
+
+WriteReport = namedtuple("WriteReport", ["written", "unchanged", "removed"])
+
+
+def _encode(content):
+    if isinstance(content, bytes):
+        return content
+    return content.encode("utf-8")
+
+
+_replace = getattr(os, "replace", os.rename)
+
+
+def _write_file(folder, name, data):
+    with open(os.path.join(folder, name), "wb") as f:
+        f.write(data)
+
+
+# the content goes to a temporary file next to the target first, readers
+# only ever see the old file or the complete new one
+def _write_file_atomic(folder, name, data):
+    import uuid
+
+    directory, base_name = os.path.split(os.path.join(folder, name))
+    temporary = ".{}.{}.tmp".format(base_name, uuid.uuid4().hex)
+    try:
+        _write_file(directory, temporary, data)
+        _replace(
+            os.path.join(directory, temporary),
+            os.path.join(directory, base_name))
+    except BaseException:
+        if os.path.exists(os.path.join(directory, temporary)):
+            os.remove(os.path.join(directory, temporary))
+        raise
+
+
+class SerialWriter(object):
+
+    def __init__(self, atomic=False):
+        self.atomic = atomic
+
+    def write(self, folder, entries):
+        write_file = _write_file_atomic if self.atomic else _write_file
+        for name, data in entries:
+            write_file(folder, name, data)
+
+
+# files are serialized by the caller and handed to a bounded pool of
+# threads, so slow opens and closes overlap instead of adding up
+class ThreadedWriter(object):
+
+    def __init__(self, workers=8, atomic=True):
+        if workers < 1:
+            raise ValueError(
+                'Workers must be at least 1, got {}'.format(workers))
+        self.workers = workers
+        self.atomic = atomic
+
+    def write(self, folder, entries):
+        write_file = _write_file_atomic if self.atomic else _write_file
+        pending = Queue(maxsize=self.workers * 2)
+        errors = []
+
+        def work():
+            while True:
+                entry = pending.get()
+                if entry is None:
+                    return
+                if errors:
+                    continue
+                try:
+                    write_file(folder, *entry)
+                except Exception as error:
+                    errors.append(error)
+
+        threads = [
+            threading.Thread(target=work) for _ in range(self.workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            for entry in entries:
+                if errors:
+                    break
+                pending.put(entry)
+        finally:
+            for _ in threads:
+                pending.put(None)
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+
+
+# a manifest left by an incremental write no longer describes the
+# files, it is dropped so the next incremental write starts over
+def write_files(folder, files, backend=None):
+    written = []
+
+    def entries():
+        for name, content in files:
+            written.append(name)
+            yield name, _encode(content)
+
+    (backend or SerialWriter()).write(folder, entries())
+    try:
+        os.remove(os.path.join(folder, MANIFEST_NAME))
+    except OSError:
+        pass
+    return WriteReport(written, [], [])
+
+
+# entries get a fixed timestamp, so the same project
+# always produces the same archive
+def write_zip(fileobj, files):
+    import zipfile
+
+    written = []
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files:
+            entry = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            entry.compress_type = zipfile.ZIP_DEFLATED
+            entry.external_attr = 0o644 << 16
+            archive.writestr(entry, _encode(content))
+            written.append(name)
+    return WriteReport(written, [], [])
+
+
+def _load_manifest(folder):
+    import json
+
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME)) as manifest:
+            return json.load(manifest)
+    except (IOError, ValueError):
+        return dict()
+
+
+def _save_manifest(folder, digests):
+    import json
+
+    with open(os.path.join(folder, MANIFEST_NAME), "w") as manifest:
+        json.dump(digests, manifest, indent=0, sort_keys=True)
+
+
+def _is_unchanged(folder, name, data, digest, manifest):
+    if manifest.get(name) != digest:
+        return False
+    try:
+        return os.path.getsize(os.path.join(folder, name)) == len(data)
+    except OSError:
+        return False
+
+
+# only files whose serialized content changed since the last incremental
+# write are written, files of removed jobs and params are deleted
+def write_incremental(folder, files, backend=None):
+    import hashlib
+
+    manifest = _load_manifest(folder)
+    digests = dict()
+    written, unchanged, removed = [], [], []
+
+    def changed():
+        for name, content in files:
+            data = _encode(content)
+            digest = hashlib.sha256(data).hexdigest()
+            digests[name] = digest
+            if _is_unchanged(folder, name, data, digest, manifest):
+                unchanged.append(name)
+            else:
+                written.append(name)
+                yield name, data
+
+    (backend or SerialWriter()).write(folder, changed())
+
+    for name in sorted(set(manifest) - set(digests)):
+        try:
+            os.remove(os.path.join(folder, name))
+        except OSError:
+            pass
+        removed.append(name)
+
+    _save_manifest(folder, digests)
+    return WriteReport(written, unchanged, removed)
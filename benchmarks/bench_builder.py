@@ -0,0 +1,55 @@
+"""Time and allocations of ``with_*`` builder chains on big templates.
+
+Derived jobs share the template ``extra``, so the cost of a chain should
+not grow with the size of the template.
+
+    python -m benchmarks.bench_builder
+"""
+import timeit
+import tracemalloc
+
+from auror_core.v1.job import Command as V1Command
+from auror_core.v2.job import Command as V2Command
+
+CONFIG_SIZES = (10, 1000, 10000)
+CHAIN_LENGTH = 20
+
+
+def template(command_class, size):
+    return command_class().with_(
+        **{"config.key.{}".format(number): "value" for number in range(size)})
+
+
+def chain(job):
+    job = job.with_name("derived").with_command("bash echo 1")
+    for number in range(CHAIN_LENGTH):
+        job = job.with_(**{"step.{}".format(number): "value"})
+    return job
+
+
+def allocated(function):
+    tracemalloc.start()
+    function()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    print("{} with_* calls per chain".format(CHAIN_LENGTH + 2))
+    print("{:>4} {:>8} {:>14} {:>16}".format(
+        "", "extra", "usec/chain", "bytes/chain"))
+    for command_class, version in ((V1Command, "v1"), (V2Command, "v2")):
+        for size in CONFIG_SIZES:
+            base = template(command_class, size)
+            seconds = min(timeit.repeat(
+                lambda: chain(base), number=100, repeat=3)) / 100
+            jobs = []
+            memory = allocated(
+                lambda: jobs.extend(chain(base) for _ in range(100))) / 100
+            print("{:>4} {:>8} {:>14.1f} {:>16.0f}".format(
+                version, size, seconds * 1e6, memory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Time building a job with many sub-commands.
+
+Both ``with_commands`` and a chain of ``with_another_command`` calls
+should cost about the same per command, whatever the number of commands.
+
+    python -m benchmarks.bench_commands
+"""
+import timeit
+
+from auror_core.v1.job import Command as V1Command
+from auror_core.v2.job import Command as V2Command
+
+SIZES = (10, 100, 1000)
+
+
+def chained(command_class, commands):
+    job = command_class()
+    for command in commands:
+        job = job.with_another_command(command)
+    return job
+
+
+def bulk(command_class, commands):
+    return command_class().with_commands(commands)
+
+
+def main():
+    print("{:>4} {:>8} {:>22} {:>22}".format(
+        "", "commands", "chained usec/command", "bulk usec/command"))
+    for command_class, version in ((V1Command, "v1"), (V2Command, "v2")):
+        for size in SIZES:
+            commands = ["bash echo {}".format(n) for n in range(size)]
+            times = [
+                min(timeit.repeat(
+                    lambda: build(command_class, commands),
+                    number=1, repeat=5)) / size * 1e6
+                for build in (chained, bulk)
+            ]
+            print("{:>4} {:>8} {:>22.2f} {:>22.2f}".format(
+                version, size, *times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Convert a v1 project to v2 by building the v2 jobs or by streaming.
+
+    python -m benchmarks.bench_converter
+"""
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from auror_core import Project
+from auror_core.v1.loader import Loader
+from auror_core.v2.converter import convert
+from auror_core.v2.job import Command
+
+from benchmarks import generators
+
+SIZE = 5000
+
+
+def build_and_write(source, destination):
+    jobs = [
+        Command(job.name, dependencies=job.dependencies,
+                config=job.extra.as_dict())
+        for job in Loader(source, workers=1).as_job_objects()
+    ]
+    Project(destination, *jobs).is_v2().write(validate=False)
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    try:
+        source = os.path.join(folder, "v1")
+        os.mkdir(source)
+        jobs, params = generators.many_commands(SIZE, 1)
+        Project(source, *jobs).with_params(*params).write()
+
+        candidates = [
+            ("build", build_and_write),
+            ("stream", convert),
+        ]
+        print("{} jobs".format(SIZE))
+        print("{:>8} {:>10} {:>10}".format("convert", "seconds", "peak MB"))
+        for name, function in candidates:
+            destination = os.path.join(folder, name)
+            os.mkdir(destination)
+            tracemalloc.start()
+            start = time.time()
+            function(source, destination)
+            seconds = time.time() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1024.0 / 1024.0
+            tracemalloc.stop()
+            print("{:>8} {:>10.3f} {:>10.1f}".format(name, seconds, peak))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
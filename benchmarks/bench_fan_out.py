@@ -0,0 +1,51 @@
+"""Build 100k jobs from one template by chaining with_* calls or fan_out.
+
+    python -m benchmarks.bench_fan_out
+"""
+import time
+import tracemalloc
+
+from benchmarks import generators
+
+SIZE = 100000
+
+
+def chain(template, rows):
+    return [
+        template.with_name(row["name"])
+        .with_(date=row["date"])
+        .with_dependencies(*row["dependencies"])
+        for row in rows
+    ]
+
+
+def fan_out(template, rows):
+    return template.fan_out(rows)
+
+
+def main():
+    print("{} jobs".format(SIZE))
+    print("{:>3} {:>8} {:>10} {:>10}".format(
+        "v", "build", "seconds", "peak MB"))
+    for version in (1, 2):
+        template = generators._template(version)
+        dependencies = [template.with_name("root")]
+        rows = [
+            dict(name="job_{}".format(number), date="2020-01-{}".format(
+                number % 28 + 1), dependencies=dependencies)
+            for number in range(SIZE)
+        ]
+        for name, build in (("chain", chain), ("fan_out", fan_out)):
+            tracemalloc.start()
+            start = time.time()
+            jobs = build(template, rows)
+            seconds = time.time() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1024.0 / 1024.0
+            tracemalloc.stop()
+            del jobs
+            print("{:>3} {:>8} {:>10.3f} {:>10.1f}".format(
+                version, name, seconds, peak))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare Loader with and without the on-disk flow cache.
+
+    python -m benchmarks.bench_flow_cache
+"""
+import os
+import shutil
+import tempfile
+import timeit
+
+from auror_core import Project
+from auror_core.v2.cache import FlowCache
+from auror_core.v2.loader import Loader
+
+from benchmarks import generators
+
+SIZE = 3000
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    cache_folder = tempfile.mkdtemp()
+    try:
+        jobs, params = generators.wide(SIZE, 2)
+        Project(folder, *jobs).with_params(*params).is_v2().write()
+        path = os.path.join(
+            folder, "{}.flow".format(os.path.basename(folder)))
+        cache = FlowCache(cache_folder)
+
+        # a fresh checkout, same content with a new mtime
+        def touch():
+            mtime = os.path.getmtime(path) + 1
+            os.utime(path, (mtime, mtime))
+
+        candidates = [
+            ("no cache", lambda: Loader(path).as_job_objects()),
+            ("cache hit", lambda: Loader(path, cache).as_job_objects()),
+            ("mtime only", lambda: (
+                touch(), Loader(path, cache).as_job_objects())),
+        ]
+        print("{} jobs".format(SIZE))
+        print("{:>12} {:>10}".format("load", "seconds"))
+        for name, load in candidates:
+            load()
+            seconds = min(timeit.repeat(load, number=1, repeat=3))
+            print("{:>12} {:>10.4f}".format(name, seconds))
+    finally:
+        shutil.rmtree(folder)
+        shutil.rmtree(cache_folder)
+
+
+if __name__ == "__main__":
+    main()
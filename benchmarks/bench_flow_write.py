@@ -0,0 +1,44 @@
+"""Time ``Project.write`` for v2 flows of growing size.
+
+The ``.flow`` document is serialized once per write, so the time spent
+per node should stay roughly constant as the flow grows.
+
+    python -m benchmarks.bench_flow_write
+"""
+import shutil
+import tempfile
+import timeit
+
+from auror_core import Project
+from auror_core.v2.job import Command
+from auror_core.v2.params import Params
+
+SIZES = (250, 500, 1000, 2000, 4000)
+
+
+def build_project(folder, size):
+    base = Command().with_command("bash echo 1").with_(retries="3")
+    jobs = [base.with_name("job_{}".format(number)) for number in range(size)]
+    params = Params(variable="my variable")
+    return Project(folder, *jobs).is_v2().with_params(params)
+
+
+def time_write(size, repeat=3):
+    folder = tempfile.mkdtemp()
+    try:
+        project = build_project(folder, size)
+        return min(timeit.repeat(project.write, number=1, repeat=repeat))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def main():
+    print("{:>8} {:>12} {:>16}".format("jobs", "seconds", "usec per job"))
+    for size in SIZES:
+        seconds = time_write(size)
+        print("{:>8} {:>12.4f} {:>16.2f}".format(
+            size, seconds, seconds / size * 1e6))
+
+
+if __name__ == "__main__":
+    main()
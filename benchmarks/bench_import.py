@@ -0,0 +1,33 @@
+"""Time ``import`` of the auror_core entry points in fresh interpreters.
+
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+
+MODULES = ("auror_core", "auror_core.v1", "auror_core.v2.loader")
+REPEAT = 5
+
+SCRIPT = (
+    "import time\n"
+    "start = time.time()\n"
+    "import {}\n"
+    "print(time.time() - start)\n"
+)
+
+
+def import_seconds(module):
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT.format(module)])
+    return float(output.decode("utf-8"))
+
+
+def main():
+    print("{:>22} {:>10}".format("module", "seconds"))
+    for module in MODULES:
+        seconds = min(import_seconds(module) for _ in range(REPEAT))
+        print("{:>22} {:>10.4f}".format(module, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare ``Loader.as_job_objects`` and ``Loader.iter_job_objects``.
+
+Reports the time to the first job, the time to scan every job name and
+the peak memory allocated while doing it.
+
+    python -m benchmarks.bench_loader_stream
+"""
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from auror_core.v2 import yaml_backend
+from auror_core.v2.loader import Loader
+
+SIZE = 5000
+
+
+def write_flow(folder, size):
+    path = os.path.join(folder, "flow.flow")
+    flow = {
+        "nodes": [
+            {
+                "name": "job_{}".format(number),
+                "type": "command",
+                "config": {"command": "bash echo {}".format(number)},
+                "dependsOn": ["job_{}".format(number - 1)] if number else [],
+                "nodes": [
+                    {
+                        "name": "inner_{}".format(number),
+                        "type": "command",
+                        "config": {"command": "bash echo inner"},
+                    }
+                ],
+            }
+            for number in range(size)
+        ],
+    }
+    with open(path, "w") as stream:
+        yaml_backend.dump(flow, stream)
+    return path
+
+
+def measure(jobs):
+    tracemalloc.start()
+    start = time.time()
+    first = None
+    names = 0
+    for job in jobs():
+        if first is None:
+            first = time.time() - start
+        names += len(job.name)
+    total = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    try:
+        path = write_flow(folder, SIZE)
+        print("{} jobs, yaml backend: {}".format(SIZE, yaml_backend.BACKEND))
+        print("{:>18} {:>12} {:>10} {:>12}".format(
+            "method", "first job", "all jobs", "peak MiB"))
+        for method in ("as_job_objects", "iter_job_objects"):
+            first, total, peak = measure(getattr(Loader(path), method))
+            print("{:>18} {:>12.4f} {:>10.4f} {:>12.1f}".format(
+                method, first, total, peak / 2.0 ** 20))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
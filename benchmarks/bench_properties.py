@@ -0,0 +1,43 @@
+"""Compare javaproperties with the built-in ``.properties`` serializer.
+
+    python -m benchmarks.bench_properties
+"""
+import timeit
+
+import javaproperties
+
+from auror_core.v1 import properties
+
+SIZE = 3000
+
+
+def build_jobs(size):
+    return [
+        {
+            u"type": u"command",
+            u"command": u"bash run.sh --step {}".format(number),
+            u"retries": u"3",
+            u"env.SPARK_MASTER": u"yarn",
+            u"dependencies": u"job_{}".format(number - 1),
+        }
+        for number in range(size)
+    ]
+
+
+def main():
+    jobs = build_jobs(SIZE)
+    candidates = [
+        ("javaproperties", lambda values: javaproperties.dumps(
+            values, comments=u"job.job", timestamp=False, sort_keys=True)),
+        ("built-in", lambda values: properties.dumps(values, u"job.job")),
+    ]
+
+    print("{:>14} {:>10}".format("serializer", "seconds"))
+    for name, dumps in candidates:
+        seconds = min(timeit.repeat(
+            lambda: [dumps(values) for values in jobs], number=1, repeat=3))
+        print("{:>14} {:>10.4f}".format(name, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare writer backends on a simulated high-latency filesystem.
+
+Every file write sleeps for ``LATENCY`` seconds first, standing in for the
+open/close round trips of NFS or FUSE mounts:
+
+    python -m benchmarks.bench_slow_fs
+"""
+import shutil
+import tempfile
+import time
+
+from auror_core import Project, writer
+from auror_core.writer import SerialWriter, ThreadedWriter
+
+from benchmarks import generators
+
+SIZE = 1000
+LATENCY = 0.002
+
+
+def slow(write_file):
+    def slow_write_file(folder, name, data):
+        time.sleep(LATENCY)
+        write_file(folder, name, data)
+    return slow_write_file
+
+
+def main():
+    jobs, params = generators.wide(SIZE, 1)
+    backends = [
+        ("serial", SerialWriter()),
+        ("serial atomic", SerialWriter(atomic=True)),
+        ("4 threads", ThreadedWriter(workers=4)),
+        ("16 threads", ThreadedWriter(workers=16)),
+        ("64 threads", ThreadedWriter(workers=64)),
+    ]
+
+    write_file = writer._write_file
+    writer._write_file = slow(write_file)
+    try:
+        print("{} files, {:.0f}ms per file".format(SIZE, LATENCY * 1000))
+        print("{:>14} {:>10}".format("backend", "seconds"))
+        for name, backend in backends:
+            folder = tempfile.mkdtemp()
+            try:
+                project = Project(folder, *jobs).with_params(*params)
+                start = time.time()
+                project.write(backend=backend)
+                print("{:>14} {:>10.4f}".format(name, time.time() - start))
+            finally:
+                shutil.rmtree(folder)
+    finally:
+        writer._write_file = write_file
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Load a 5k file v1 project folder serially and with a process pool.
+
+    python -m benchmarks.bench_v1_loader
+"""
+import multiprocessing
+import shutil
+import tempfile
+import timeit
+
+from auror_core import Project
+from auror_core.v1.loader import Loader
+
+from benchmarks import generators
+
+SIZE = 5000
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    try:
+        jobs, params = generators.many_commands(SIZE, 1)
+        Project(folder, *jobs).with_params(*params).write()
+        workers = multiprocessing.cpu_count()
+
+        candidates = [
+            ("serial", lambda: Loader(folder, workers=1).as_project()),
+            ("{} workers".format(workers),
+             lambda: Loader(folder, workers=workers).as_project()),
+        ]
+        print("{} files".format(SIZE))
+        print("{:>12} {:>10}".format("load", "seconds"))
+        for name, load in candidates:
+            load()
+            seconds = min(timeit.repeat(load, number=1, repeat=3))
+            print("{:>12} {:>10.4f}".format(name, seconds))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compare the pure Python and libyaml backends on a large ``.flow``.
+
+    python -m benchmarks.bench_yaml_backend
+"""
+import timeit
+
+import yaml
+
+from auror_core.v2 import yaml_backend
+
+SIZE = 3000
+
+
+def build_flow(size):
+    return {
+        "config": {"retries": "2", "env.SPARK_MASTER": "yarn"},
+        "nodes": [
+            {
+                "name": "job_{}".format(number),
+                "type": "command",
+                "config": {"command": "bash echo {}".format(number)},
+                "dependsOn": ["job_{}".format(number - 1)] if number else [],
+                "nodes": [],
+            }
+            for number in range(size)
+        ],
+    }
+
+
+def main():
+    content = yaml_backend.dump(build_flow(SIZE))
+    candidates = [("python", yaml.SafeLoader, yaml.SafeDumper)]
+    if yaml.__with_libyaml__:
+        candidates.append(("libyaml", yaml.CSafeLoader, yaml.CSafeDumper))
+
+    print("active backend: {}".format(yaml_backend.BACKEND))
+    print("{:>8} {:>10} {:>10}".format("backend", "load", "dump"))
+    for name, loader, dumper in candidates:
+        data = yaml.load(content, Loader=loader)
+        load = min(timeit.repeat(
+            lambda: yaml.load(content, Loader=loader), number=1, repeat=3))
+        dump = min(timeit.repeat(
+            lambda: yaml.dump(data, Dumper=dumper, default_flow_style=False),
+            number=1, repeat=3))
+        print("{:>8} {:>10.4f} {:>10.4f}".format(name, load, dump))
+
+
+if __name__ == "__main__":
+    main()
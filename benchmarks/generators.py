@@ -0,0 +1,108 @@
+"""Synthetic flows for the benchmark suite.
+
+Every generator receives the number of jobs and the auror_core version
+(1 or 2) and returns a ``(jobs, params)`` pair ready for ``Project``.
+"""
+from auror_core.v1 import job as v1_job, params as v1_params
+from auror_core.v2 import job as v2_job, params as v2_params
+
+MODULES = {
+    1: (v1_job, v1_params),
+    2: (v2_job, v2_params),
+}
+
+COMMANDS_PER_JOB = 10
+PARAMS_PER_SET = 100
+
+
+def _template(version):
+    job, _ = MODULES[version]
+    return job.Command() \
+        .with_command("${python} -c 'from flows import run; run()'") \
+        .with_(**{
+            "retries": "3",
+            "retry.backoff": "30000",
+            "env.SPARK_MASTER": "yarn",
+            "failure.emails": "bigdata@example.com",
+        })
+
+
+def wide(size, version):
+    template = _template(version)
+    root = template.with_name("root")
+    jobs = [root] + [
+        template.with_name("job_{}".format(number)).with_dependencies(root)
+        for number in range(size - 1)
+    ]
+    return jobs, []
+
+
+def deep(size, version):
+    template = _template(version)
+    jobs = [template.with_name("job_0")]
+    for number in range(1, size):
+        jobs.append(
+            template.with_name("job_{}".format(number))
+            .with_dependencies(jobs[-1]))
+    return jobs, []
+
+
+def nested(size, version, fanout=10):
+    if version != 2:
+        raise ValueError("nested flows only exist in v2")
+    template = _template(version)
+    level = [
+        template.with_name("job_{}".format(number)) for number in range(size)
+    ]
+    depth = 0
+    while len(level) > fanout:
+        depth += 1
+        level = [
+            template.with_name("flow_{}_{}".format(depth, number))
+            .with_nodes(*level[start:start + fanout])
+            for number, start in enumerate(range(0, len(level), fanout))
+        ]
+    return level, []
+
+
+def many_commands(size, version):
+    template = _template(version)
+    commands = [
+        "bash run_step.sh {}".format(step) for step in range(COMMANDS_PER_JOB)
+    ]
+    jobs = [
+        template.with_name("job_{}".format(number)).with_commands(commands)
+        for number in range(size)
+    ]
+    return jobs, []
+
+
+def many_params(size, version):
+    _, params = MODULES[version]
+    jobs, _ = wide(size, version)
+    sets = max(1, size // PARAMS_PER_SET)
+    param_sets = [
+        params.Params(
+            "params_{}".format(number),
+            **{
+                "param_{}_{}".format(number, key): "value {}".format(key)
+                for key in range(PARAMS_PER_SET)
+            })
+        for number in range(sets)
+    ]
+    param_sets.append(params.Env(
+        "envs",
+        **{"VARIABLE_{}".format(key): "value" for key in range(sets)}))
+    return jobs, param_sets
+
+
+SHAPES = {
+    "wide": wide,
+    "deep": deep,
+    "nested": nested,
+    "many_commands": many_commands,
+    "many_params": many_params,
+}
+
+V1_SHAPES = ("wide", "deep", "many_commands", "many_params")
+V2_SHAPES = ("wide", "deep", "nested", "many_commands", "many_params")
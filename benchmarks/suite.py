@@ -0,0 +1,253 @@
+"""Benchmark suite for builders, writers, Loader and Dumper.
+
+Times and memory-profiles every case on synthetic flows (see
+``benchmarks.generators``) and compares the results with a stored
+baseline:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --sizes 10,1000,50000 --cases write_v2
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json
+
+``--compare`` exits with 1 when a case got slower or bigger than the
+baseline by more than ``--tolerance``. Timings only compare on the same
+machine, a baseline saved on another machine, Python or yaml backend is
+still printed but never fails.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from auror_core import Project
+from auror_core.v2 import yaml_backend
+from auror_core.v2.dumper import Dumper
+from auror_core.v2.loader import Loader
+
+from benchmarks import generators
+
+DEFAULT_SIZES = (10, 1000)
+
+# timings and peaks below these are too noisy to flag as regressions
+MIN_SECONDS = 0.01
+MIN_BYTES = 64 * 1024
+
+# runs per case, the fastest one is kept
+REPEAT = 7
+
+
+class Case(object):
+    max_size = None
+
+    def __init__(self, name, shape, version, size):
+        self.name = "{}/{}/{}".format(name, shape, size)
+        self.shape = shape
+        self.version = version
+        self.size = size
+
+    def generate(self):
+        return generators.SHAPES[self.shape](self.size, self.version)
+
+    def project(self, folder, jobs, params):
+        project = Project(folder, *jobs).with_params(*params)
+        return project.is_v2() if self.version == 2 else project
+
+    # returns the state that run receives, not measured
+    def setup(self, folder):
+        return None
+
+    def run(self, state):
+        raise NotImplementedError
+
+
+class BuildCase(Case):
+
+    def run(self, state):
+        self.generate()
+
+
+class WriteCase(Case):
+
+    def setup(self, folder):
+        return self.project(folder, *self.generate())
+
+    def run(self, project):
+        project.write()
+
+
+class LoaderCase(Case):
+
+    def setup(self, folder):
+        project = self.project(folder, *self.generate())
+        project.write()
+        name = os.path.basename(folder)
+        return os.path.join(folder, "{}.flow".format(name))
+
+    def run(self, path):
+        Loader(path).as_job_objects()
+
+
+class DumperCase(Case):
+
+    def setup(self, folder):
+        jobs, _ = self.generate()
+        return Dumper(folder), jobs
+
+    def run(self, state):
+        dumper, jobs = state
+        dumper.dump_jobs(*jobs)
+
+
+def all_cases(sizes):
+    for size in sizes:
+        for shape in generators.V1_SHAPES:
+            yield BuildCase("build_v1", shape, 1, size)
+            yield WriteCase("write_v1", shape, 1, size)
+        for shape in generators.V2_SHAPES:
+            yield BuildCase("build_v2", shape, 2, size)
+            yield WriteCase("write_v2", shape, 2, size)
+            yield LoaderCase("loader", shape, 2, size)
+            yield DumperCase("dumper", shape, 2, size)
+
+
+def measure(case, repeat):
+    folder = tempfile.mkdtemp()
+    try:
+        state = case.setup(folder)
+        times = [timeit.timeit(lambda: case.run(state), number=1)]
+        while len(times) < repeat and sum(times) < 1.0:
+            times.append(timeit.timeit(lambda: case.run(state), number=1))
+        seconds = min(times)
+
+        tracemalloc.start()
+        case.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"seconds": seconds, "peak_bytes": peak}
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def run_suite(sizes, selected=None, out=sys.stdout):
+    results = dict()
+    print("{:<36} {:>12} {:>12}".format("case", "seconds", "peak KiB"),
+          file=out)
+    for case in all_cases(sizes):
+        if selected and not any(name in case.name for name in selected):
+            continue
+        if case.max_size and case.size > case.max_size:
+            continue
+        try:
+            result = measure(case, repeat=REPEAT)
+        except Exception as error:
+            print("{:<36} {}: {}".format(
+                case.name, type(error).__name__, error), file=out)
+            continue
+        results[case.name] = result
+        print("{:<36} {:>12.4f} {:>12.1f}".format(
+            case.name, result["seconds"], result["peak_bytes"] / 1024.0),
+            file=out)
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.STDOUT).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# where the timings were taken, they are only comparable on the same one
+def _environment():
+    return {
+        "machine": "{} {}".format(platform.node(), platform.machine()),
+        "python": platform.python_version(),
+        "yaml_backend": yaml_backend.BACKEND,
+    }
+
+
+def save(results, path):
+    document = dict(
+        _environment(),
+        commit=_commit(),
+        created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        results=results)
+    with open(path, "w") as baseline:
+        json.dump(document, baseline, indent=2, sort_keys=True)
+
+
+def compare(results, path, tolerance, out=sys.stdout):
+    with open(path) as baseline:
+        document = json.load(baseline)
+    print("\ncompared with {} (commit {})".format(
+        path, document.get("commit")), file=out)
+    different = [
+        key for key, value in sorted(_environment().items())
+        if document.get(key) != value
+    ]
+    if different:
+        print("warning: baseline taken with another {}, regressions are "
+              "not reported".format(", ".join(different)), file=out)
+    print("{:<36} {:>12} {:>12}".format("case", "time", "memory"), file=out)
+
+    regressions = []
+    for name, result in sorted(results.items()):
+        before = document["results"].get(name)
+        if not before:
+            continue
+        ratios = [
+            result[key] / float(before[key]) if before[key] else 1.0
+            for key in ("seconds", "peak_bytes")
+        ]
+        if max(result["seconds"], before["seconds"]) < MIN_SECONDS:
+            ratios[0] = 1.0
+        if max(result["peak_bytes"], before["peak_bytes"]) < MIN_BYTES:
+            ratios[1] = 1.0
+        flag = ""
+        if any(ratio > 1 + tolerance for ratio in ratios):
+            regressions.append(name)
+            flag = "  slower" if different else "  REGRESSION"
+        print("{:<36} {:>11.2f}x {:>11.2f}x{}".format(
+            name, ratios[0], ratios[1], flag), file=out)
+    return [] if different else regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma separated job counts (default: %(default)s)")
+    parser.add_argument(
+        "--cases", default="",
+        help="comma separated substrings of the cases to run")
+    parser.add_argument("--save", help="store the results as a baseline")
+    parser.add_argument("--compare", help="baseline to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="allowed slowdown before a case is a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    selected = [name for name in args.cases.split(",") if name]
+    results = run_suite(sizes, selected)
+
+    if args.save:
+        save(results, args.save)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
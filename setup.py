@@ -17,11 +17,14 @@ setup(
     install_requires=[
         "javaproperties==0.5.1",
         "pyaml==18.11.0",
-        "autopep8==1.4.4",
     ],
     extras_require={
-        "test": ["mock","twine"],
+        "test": ["mock", "twine", "pycodestyle"],
         "docs": ["Sphinx"],
+        "pep8": ["autopep8==1.4.4"],
+    },
+    packages=find_packages(exclude=["tests", "tests.*", "benchmarks"]),
+    entry_points={
+        "console_scripts": ["auror-batch = auror_core.batch:main"],
     },
-    packages=find_packages(),
 )
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil, tempfile
+from unittest import TestCase
+
+import mock
+
+from auror_core import Project
+from auror_core.batch import write_projects, run_scripts, convert_projects, main
+from auror_core.v1.job import Command
+from auror_core.v2.job import Command as V2Command
+
+
+job = Command().with_name("job1").with_command("echo 1")
+
+SCRIPT = """
+from auror_core import Project
+from auror_core.v1.job import Command
+
+job = Command().with_name("job1").with_command("echo 1")
+Project({folder!r}, job).write()
+"""
+
+
+class WriteProjectsTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.folders = []
+        for number in range(3):
+            folder = os.path.join(self.test_dir, "project_{}".format(number))
+            os.mkdir(folder)
+            self.folders.append(folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_write_projects_in_parallel(self):
+        projects = [Project(folder, job) for folder in self.folders]
+        projects.append(Project(self.folders[0], V2Command().with_name("v2")).is_v2())
+
+        results = write_projects(projects, workers=2)
+
+        self.assertEqual(self.folders + [self.folders[0]], [r.name for r in results])
+        self.assertTrue(all(result.error is None for result in results))
+        self.assertTrue(all(result.seconds >= 0 for result in results))
+        for folder in self.folders:
+            self.assertTrue("job1.job" in os.listdir(folder))
+        self.assertTrue("flow20.project" in os.listdir(self.folders[0]))
+
+    def test_errors_are_collected_without_aborting_the_batch(self):
+        missing = os.path.join(self.test_dir, "missing")
+        projects = [
+            Project(self.folders[0], job),
+            Project(missing, job),
+            Project(self.folders[1], job),
+        ]
+
+        results = write_projects(projects, workers=2)
+
+        self.assertEqual(None, results[0].error)
+        self.assertTrue("IOError" in results[1].error or "FileNotFoundError" in results[1].error)
+        self.assertEqual(None, results[2].error)
+        self.assertTrue("job1.job" in os.listdir(self.folders[1]))
+
+    def test_projects_that_can_not_be_pickled_are_reported(self):
+        unpicklable = Project(self.folders[0], job).with_params(lambda: None)
+
+        results = write_projects([unpicklable, Project(self.folders[1], job)], workers=2)
+
+        self.assertTrue(results[0].error)
+        self.assertEqual(0.0, results[0].seconds)
+        self.assertEqual(None, results[1].error)
+
+    def test_write_projects_serially(self):
+        results = write_projects([Project(self.folders[0], job)], workers=1)
+
+        self.assertEqual(None, results[0].error)
+        self.assertTrue("job1.job" in os.listdir(self.folders[0]))
+
+
+class RunScriptsTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_script(self, name, content):
+        path = os.path.join(self.test_dir, name)
+        with open(path, "w") as script:
+            script.write(content)
+        return path
+
+    def test_run_scripts(self):
+        folder = os.path.join(self.test_dir, "project")
+        os.mkdir(folder)
+        good = self.write_script("good.py", SCRIPT.format(folder=folder))
+        bad = self.write_script("bad.py", "raise ValueError('broken flow')\n")
+
+        results = run_scripts([good, bad], workers=2)
+
+        self.assertEqual([good, bad], [result.name for result in results])
+        self.assertEqual(None, results[0].error)
+        self.assertTrue("broken flow" in results[1].error)
+        self.assertTrue("job1.job" in os.listdir(folder))
+
+    @mock.patch("auror_core.batch.print", create=True)
+    def test_main_returns_an_error_code_on_failures(self, mock_print):
+        good = self.write_script("good.py", "import sys\nsys.exit(0)\n")
+        bad = self.write_script("bad.py", "import sys\nsys.exit(2)\n")
+
+        self.assertEqual(0, main([good, "--workers", "1"]))
+        self.assertEqual(1, main([good, bad, "--workers", "2"]))
+
+
+class ConvertProjectsTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_convert_projects_in_parallel(self):
+        folders = []
+        for number in range(3):
+            source = os.path.join(self.test_dir, "v1_{}".format(number))
+            os.mkdir(source)
+            Project(source, job).write()
+            folders.append((source, os.path.join(self.test_dir, "v2_{}".format(number))))
+        missing = os.path.join(self.test_dir, "missing")
+        folders.append((missing, os.path.join(self.test_dir, "v2_missing")))
+
+        results = convert_projects(folders, workers=2)
+
+        self.assertEqual([source for source, _ in folders], [r.name for r in results])
+        self.assertEqual([None] * 3, [result.error for result in results[:3]])
+        self.assertTrue("Folder does not exists" in results[3].error)
+        with open(os.path.join(self.test_dir, "v2_0", "v2_0.flow")) as f:
+            self.assertTrue("name: job1" in f.read())
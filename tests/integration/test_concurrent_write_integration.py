@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil, tempfile
+from unittest import TestCase, skipUnless
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+from auror_core import Project
+from auror_core.writer import MANIFEST_NAME, ThreadedWriter
+from auror_core.v1.job import Command
+
+
+jobs = [
+    Command().with_name("job_{}".format(number)).with_command("echo {}".format(number))
+    for number in range(100)
+]
+
+
+class ConcurrentWriteTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.expected_dir = tempfile.mkdtemp()
+        Project(self.expected_dir, *jobs).write()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+        shutil.rmtree(self.expected_dir, ignore_errors=True)
+
+    def assertSameFiles(self):
+        self.assertEqual(
+            sorted(os.listdir(self.expected_dir)),
+            sorted(name for name in os.listdir(self.test_dir) if name != MANIFEST_NAME))
+        for name in os.listdir(self.expected_dir):
+            with open(os.path.join(self.expected_dir, name)) as expected, \
+                    open(os.path.join(self.test_dir, name)) as actual:
+                self.assertEqual(expected.read(), actual.read())
+
+    def test_threaded_write(self):
+        report = Project(self.test_dir, *jobs).write(backend=ThreadedWriter(4))
+
+        self.assertEqual(["job_{}.job".format(number) for number in range(100)], report.written)
+        self.assertSameFiles()
+
+    def test_threaded_incremental_write(self):
+        project = Project(self.test_dir, *jobs)
+        project.write(incremental=True, backend=ThreadedWriter(4))
+        self.assertSameFiles()
+        os.remove(os.path.join(self.test_dir, "job_3.job"))
+
+        report = project.write(incremental=True, backend=ThreadedWriter(4))
+
+        self.assertEqual(["job_3.job"], report.written)
+        self.assertEqual(99, len(report.unchanged))
+
+    @skipUnless(asyncio, "asyncio is not available")
+    def test_write_async(self):
+        project = Project(self.test_dir, *jobs)
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            report = loop.run_until_complete(project.write_async(backend=ThreadedWriter(4)))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+        self.assertEqual(100, len(report.written))
+        self.assertSameFiles()
+
+    @skipUnless(hasattr(asyncio, "run"), "asyncio.run is not available")
+    def test_write_async_with_asyncio_run(self):
+        project = Project(self.test_dir, *jobs)
+
+        report = asyncio.run(project.write_async(backend=ThreadedWriter(4)))
+
+        self.assertEqual(100, len(report.written))
+        self.assertSameFiles()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil, tempfile
+from unittest import TestCase
+
+from auror_core import Project
+from auror_core.writer import MANIFEST_NAME
+from auror_core.v1.job import Command
+from auror_core.v1.params import Params
+from auror_core.v2.job import Command as V2Command
+
+
+job1 = Command().with_name("job1").with_command("echo 1")
+job2 = Command().with_name("job2").with_command("echo 2")
+params = Params("params", retries="2")
+
+
+class IncrementalWriteTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def list_files(self):
+        return sorted(os.listdir(self.test_dir))
+
+    def read(self, name):
+        with open(os.path.join(self.test_dir, name)) as f:
+            return f.read()
+
+    def test_full_write_reports_every_file(self):
+        report = Project(self.test_dir, job1, job2).with_params(params).write()
+
+        self.assertEqual(["params.properties", "job1.job", "job2.job"], report.written)
+        self.assertEqual([], report.unchanged)
+        self.assertEqual([], report.removed)
+
+    def test_first_incremental_write_writes_everything_and_a_manifest(self):
+        project = Project(self.test_dir, job1, job2).with_params(params)
+        report = project.write(incremental=True)
+
+        self.assertEqual(["params.properties", "job1.job", "job2.job"], report.written)
+        self.assertEqual(
+            [MANIFEST_NAME, "job1.job", "job2.job", "params.properties"],
+            self.list_files())
+        self.assertEqual(
+            "#job1.job\ncommand=echo 1\ntype=command\n", self.read("job1.job"))
+
+    def test_unchanged_files_are_not_rewritten(self):
+        Project(self.test_dir, job1, job2).write(incremental=True)
+        job_path = os.path.join(self.test_dir, "job1.job")
+        os.utime(job_path, (0, 0))
+
+        changed = job2.with_command("echo 3")
+        report = Project(self.test_dir, job1, changed).write(incremental=True)
+
+        self.assertEqual(["job2.job"], report.written)
+        self.assertEqual(["job1.job"], report.unchanged)
+        self.assertEqual(0, os.path.getmtime(job_path))
+        self.assertTrue("echo 3" in self.read("job2.job"))
+
+    def test_full_write_between_incremental_writes(self):
+        Project(self.test_dir, job1).write(incremental=True)
+        Project(self.test_dir, job1.with_command("echo 2")).write()
+
+        report = Project(self.test_dir, job1).write(incremental=True)
+
+        self.assertEqual(["job1.job"], report.written)
+        self.assertEqual([], report.unchanged)
+        self.assertTrue("command=echo 1" in self.read("job1.job"))
+
+    def test_files_of_removed_jobs_are_deleted(self):
+        Project(self.test_dir, job1, job2).with_params(params).write(incremental=True)
+
+        report = Project(self.test_dir, job1).write(incremental=True)
+
+        self.assertEqual(["job2.job", "params.properties"], report.removed)
+        self.assertEqual([MANIFEST_NAME, "job1.job"], self.list_files())
+
+    def test_files_changed_outside_are_rewritten(self):
+        Project(self.test_dir, job1).write(incremental=True)
+        with open(os.path.join(self.test_dir, "job1.job"), "w") as f:
+            f.write("changed")
+
+        report = Project(self.test_dir, job1).write(incremental=True)
+
+        self.assertEqual(["job1.job"], report.written)
+        self.assertEqual(
+            "#job1.job\ncommand=echo 1\ntype=command\n", self.read("job1.job"))
+
+    def test_v2_incremental_write(self):
+        flow_name = "{}.flow".format(os.path.basename(self.test_dir))
+        job = V2Command().with_name("job1").with_command("echo 1")
+        project = Project(self.test_dir, job).is_v2()
+
+        first = project.write(incremental=True)
+        second = project.write(incremental=True)
+
+        self.assertEqual([flow_name, "flow20.project"], first.written)
+        self.assertEqual([], second.written)
+        self.assertEqual([flow_name, "flow20.project"], second.unchanged)
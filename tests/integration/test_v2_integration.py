@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil, tempfile
+from unittest import TestCase
+
+import yaml
+
+from auror_core import Project
+from auror_core.v2.job import Command
+from auror_core.v2.params import Params, Env
+
+
+class TestCaseWithNecessaryConditions(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.flow_name = "{}.flow".format(os.path.basename(self.test_dir))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def list_files(self):
+        return os.listdir(self.test_dir)
+
+    def load_flow(self):
+        with open(os.path.join(self.test_dir, self.flow_name)) as f:
+            return yaml.safe_load(f)
+
+
+class FlowFileTest(TestCaseWithNecessaryConditions):
+
+    def test_check_if_directory_created_has_flow_and_project_files(self):
+        job = Command().with_name("job1").with_command("echo 1")
+        Project(self.test_dir, job).is_v2().write()
+
+        tmp_dir = self.list_files()
+
+        self.assertEqual(2, len(tmp_dir))
+        self.assertTrue(self.flow_name in tmp_dir)
+        self.assertTrue("flow20.project" in tmp_dir)
+
+    def test_all_jobs_are_written_in_order(self):
+        jobs = [
+            Command().with_name("job{}".format(i)).with_command("echo 1")
+            for i in range(5)
+        ]
+        Project(self.test_dir, *jobs).is_v2().write()
+
+        names = [node["name"] for node in self.load_flow()["nodes"]]
+        self.assertEqual(["job0", "job1", "job2", "job3", "job4"], names)
+
+    def test_params_and_jobs_are_written_in_the_same_flow(self):
+        job = Command().with_name("job1").with_command("echo 1")
+        params = Params(variable="my variable")
+        env = Env(VARIABLE="env variable")
+        Project(self.test_dir, job).is_v2().with_params(params, env).write()
+
+        flow = self.load_flow()
+        self.assertEqual(
+            {"variable": "my variable", "env.VARIABLE": "env variable"},
+            flow["config"])
+        self.assertEqual(["job1"], [node["name"] for node in flow["nodes"]])
+
+    def test_writing_twice_does_not_duplicate_nodes(self):
+        job = Command().with_name("job1").with_command("echo 1")
+        project = Project(self.test_dir, job).is_v2()
+        project.write()
+        project.write()
+
+        self.assertEqual(1, len(self.load_flow()["nodes"]))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import zipfile
+from unittest import TestCase
+
+from auror_core import Project
+from auror_core.v1.job import Command
+from auror_core.v1.params import Params
+from auror_core.v2.job import Command as V2Command
+from auror_core.v2.params import Params as V2Params
+
+
+job1 = Command().with_name("job1").with_command("echo 1")
+job2 = Command().with_name("job2").with_command("echo 2").with_dependencies(job1)
+params = Params("params", retries="2")
+
+
+class ProjectZipTest(TestCase):
+
+    def test_v1_project_to_zip_bytes(self):
+        content = Project("project", job1, job2).with_params(params).to_zip_bytes()
+
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            self.assertEqual(
+                ["params.properties", "job1.job", "job2.job"], archive.namelist())
+            self.assertEqual(
+                b"#job2.job\ncommand=echo 2\ndependencies=job1\ntype=command\n",
+                archive.read("job2.job"))
+            self.assertEqual(zipfile.ZIP_DEFLATED, archive.getinfo("job1.job").compress_type)
+
+    def test_v2_project_to_zip(self):
+        job = V2Command().with_name("job1").with_command("echo 1")
+        project = Project(os.path.join("some", "project"), job) \
+            .is_v2().with_params(V2Params(variable="1"))
+        fileobj = io.BytesIO()
+
+        report = project.to_zip(fileobj)
+
+        self.assertEqual(["project.flow", "flow20.project"], report.written)
+        with zipfile.ZipFile(fileobj) as archive:
+            self.assertEqual(["project.flow", "flow20.project"], archive.namelist())
+            self.assertEqual(b"azkaban-flow-version: 2.0", archive.read("flow20.project"))
+            self.assertTrue(b"name: job1" in archive.read("project.flow"))
+            self.assertTrue(b"variable: '1'" in archive.read("project.flow"))
+
+    def test_zip_does_not_touch_the_disk(self):
+        folder = os.path.join("this", "folder", "does", "not", "exist")
+
+        Project(folder, job1).to_zip_bytes()
+
+        self.assertFalse(os.path.exists(folder))
+
+    def test_the_same_project_always_produces_the_same_zip(self):
+        project = Project("project", job1, job2).with_params(params)
+
+        self.assertEqual(project.to_zip_bytes(), project.to_zip_bytes())
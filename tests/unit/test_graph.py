@@ -0,0 +1,173 @@
+from unittest import TestCase
+
+from auror_core.graph import FlowGraph, InvalidFlowError
+from auror_core.v1 import job as v1_job
+from auror_core.v2.job import Command, Job
+
+
+class FlowGraphTest(TestCase):
+
+    def setUp(self):
+        self.first = Command().with_name("first")
+        self.second = Command().with_name("second").with_dependencies("first")
+        self.third = Command().with_name("third") \
+            .with_dependencies("first", "second")
+        self.graph = FlowGraph([self.third, self.second, self.first])
+
+    def test_index_by_name(self):
+        self.assertEqual(3, len(self.graph))
+        self.assertTrue("second" in self.graph)
+        self.assertFalse("fourth" in self.graph)
+        self.assertIs(self.second, self.graph["second"])
+        self.assertEqual(
+            [self.third, self.second, self.first], list(self.graph))
+
+    def test_adjacency_lists(self):
+        self.assertEqual(("first", "second"), self.graph.dependencies["third"])
+        self.assertEqual(["third", "second"], self.graph.dependents["first"])
+        self.assertEqual([], self.graph.dependents["third"])
+
+    def test_topological_order(self):
+        self.assertEqual(
+            [self.first, self.second, self.third],
+            self.graph.topological_order())
+
+    def test_topological_order_keeps_the_given_order_on_ties(self):
+        jobs = [Command().with_name(name) for name in "cab"]
+        self.assertEqual(jobs, FlowGraph(jobs).topological_order())
+
+    def test_valid_graph(self):
+        self.assertEqual([], self.graph.errors())
+        self.assertIs(self.graph, self.graph.validate())
+        self.assertIsNone(self.graph.find_cycle())
+
+    def test_unknown_dependencies(self):
+        graph = FlowGraph([self.second, self.third])
+
+        self.assertEqual(
+            [("second", "first"), ("third", "first")],
+            graph.unknown_dependencies())
+        with self.assertRaises(InvalidFlowError) as context:
+            graph.validate()
+        self.assertEqual([
+            "job 'second' depends on unknown job 'first'",
+            "job 'third' depends on unknown job 'first'",
+        ], context.exception.errors)
+
+    def test_cycle(self):
+        jobs = [
+            Command().with_name("a").with_dependencies("c"),
+            Command().with_name("b").with_dependencies("a"),
+            Command().with_name("c").with_dependencies("b"),
+            Command().with_name("d").with_dependencies("c"),
+        ]
+        graph = FlowGraph(jobs)
+
+        self.assertEqual(["b", "c", "a"], graph.find_cycle())
+        with self.assertRaises(InvalidFlowError) as context:
+            graph.topological_order()
+        self.assertEqual(
+            ["dependency cycle 'b' -> 'c' -> 'a' -> 'b'"],
+            context.exception.errors)
+
+    def test_self_dependency(self):
+        graph = FlowGraph([Command().with_name("a").with_dependencies("a")])
+        self.assertEqual(["a"], graph.find_cycle())
+
+    def test_duplicated_names(self):
+        graph = FlowGraph([self.first, self.first.with_command("echo")])
+
+        self.assertEqual(1, len(graph))
+        self.assertEqual(["duplicated job 'first'"], graph.errors())
+
+    def test_nested_nodes_are_a_graph_of_their_own(self):
+        inner = Job(name="inner").with_dependencies("unknown")
+        flow = Job(name="flow", nodes=[self.first, self.second, inner])
+        graph = FlowGraph([flow, Job(name="after").with_dependencies(flow)])
+
+        self.assertEqual(["flow", "after"], list(graph.jobs))
+        self.assertEqual(
+            ["first", "second", "inner"], list(graph.flows["flow"].jobs))
+        self.assertEqual(
+            ["flow: job 'inner' depends on unknown job 'unknown'"],
+            graph.errors())
+
+    def test_v1_jobs(self):
+        first = v1_job.Command().with_name("first")
+        second = v1_job.Command().with_name("second").with_dependencies(first)
+
+        graph = FlowGraph([second, first])
+
+        self.assertEqual([first, second], graph.topological_order())
+        self.assertEqual({}, dict(graph.flows))
+
+    def test_large_graph(self):
+        jobs = [Command().with_name("job_0")] + [
+            Command().with_name("job_{}".format(number))
+            .with_dependencies("job_{}".format(number // 2))
+            for number in range(1, 50000)
+        ]
+        graph = FlowGraph(reversed(jobs))
+
+        self.assertEqual([], graph.errors())
+        order = [job.name for job in graph.topological_order()]
+        position = dict((name, index) for index, name in enumerate(order))
+        self.assertTrue(all(
+            position[job.name] > position[job.dependencies[0]]
+            for job in jobs[1:]))
+
+
+class FlowGraphQueryTest(TestCase):
+
+    def setUp(self):
+        self.inner = Command().with_name("inner")
+        self.flow = Job(name="flow", nodes=[
+            self.inner,
+            Job(name="sub", nodes=[Job(name="deepest")]),
+        ])
+        self.jobs = [
+            Command().with_name("a"),
+            Command().with_name("b").with_dependencies("a"),
+            Command().with_name("c").with_dependencies("b"),
+            Command().with_name("d").with_dependencies("a"),
+            self.flow.with_dependencies("c", "d"),
+            Command().with_name("e"),
+        ]
+        self.graph = FlowGraph(self.jobs)
+
+    def test_of_type(self):
+        self.assertEqual(
+            ["a", "b", "c", "d", "e"],
+            [job.name for job in self.graph.of_type("command")])
+        self.assertEqual([], self.graph.of_type("noop"))
+
+    def test_find_nested_jobs(self):
+        self.assertIs(self.jobs[0], self.graph.find("a"))
+        self.assertIs(self.inner, self.graph.find("flow/inner"))
+        self.assertEqual(
+            "deepest", self.graph.find(("flow", "sub", "deepest")).name)
+        with self.assertRaises(KeyError):
+            self.graph.find("flow/missing")
+
+    def test_subgraph(self):
+        subgraph = self.graph.subgraph("flow/sub")
+
+        self.assertEqual(("flow", "sub"), subgraph.path)
+        self.assertEqual(["deepest"], list(subgraph.jobs))
+        self.assertIs(self.graph.flows["flow"], self.graph.subgraph("flow"))
+
+    def test_upstream(self):
+        upstream = self.graph.upstream("c")
+
+        self.assertEqual(["c", "b", "a"], list(upstream.jobs))
+        self.assertEqual(
+            ["a", "b", "c"],
+            [job.name for job in upstream.topological_order()])
+        self.assertEqual([], upstream.errors())
+
+    def test_downstream(self):
+        downstream = self.graph.downstream("b")
+
+        self.assertEqual(["b", "c", "flow"], list(downstream.jobs))
+        self.assertEqual(["flow"], downstream.dependents["c"])
+        self.assertEqual(["e"], list(self.graph.downstream("e").jobs))
@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+
+from unittest import TestCase
+
+
+HEAVY_MODULES = ('yaml', 'javaproperties', 'autopep8', 'pycodestyle', 'zipfile')
+
+REPORT = (
+    '\nimport json, sys\n'
+    'print(json.dumps(sorted(name for name in {!r} if name in sys.modules)))\n'
+)
+
+
+# every check runs in a fresh interpreter, so modules already loaded by
+# the test run itself do not hide an eager import
+class ImportTest(TestCase):
+
+    def loaded_heavy_modules(self, code):
+        output = subprocess.check_output(
+            [sys.executable, '-c', code + REPORT.format(HEAVY_MODULES)])
+        return json.loads(output.decode('utf-8'))
+
+    def test_import_auror_core_is_light(self):
+        self.assertEqual([], self.loaded_heavy_modules('import auror_core'))
+
+    def test_import_v1_is_light(self):
+        self.assertEqual([], self.loaded_heavy_modules(
+            'import auror_core.v1.job, auror_core.v1.params'))
+
+    def test_import_v2_loader_is_light(self):
+        self.assertEqual([], self.loaded_heavy_modules(
+            'import auror_core.v2.loader, auror_core.v2.params'))
+
+    def test_yaml_is_loaded_when_a_flow_is_serialized(self):
+        self.assertEqual(['yaml'], self.loaded_heavy_modules(
+            'from auror_core.v2.serializer import FlowSerializer\n'
+            'FlowSerializer().dumps()'))
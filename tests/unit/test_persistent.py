@@ -0,0 +1,104 @@
+import copy
+import pickle
+
+from unittest import TestCase
+
+from auror_core.persistent import PersistentMap, freeze
+from auror_core.v1.job import Command as V1Command
+from auror_core.v2.job import Command as V2Command
+
+
+class PersistentMapTest(TestCase):
+
+    def setUp(self):
+        self.base = PersistentMap({"retries": "3", "command": "echo 1"})
+
+    def test_merge_returns_a_new_map_and_keeps_the_original(self):
+        merged = self.base.merge({"retries": "5", "timeout": "60"})
+
+        self.assertEqual(
+            {"retries": "5", "command": "echo 1", "timeout": "60"}, merged)
+        self.assertEqual({"retries": "3", "command": "echo 1"}, self.base)
+
+    def test_merge_shares_the_original_map(self):
+        merged = self.base.merge({"timeout": "60"})
+
+        self.assertIs(self.base, merged._parent)
+        self.assertEqual({"timeout": "60"}, merged._items)
+
+    def test_merge_nothing_returns_the_same_map(self):
+        self.assertIs(self.base, self.base.merge({}))
+
+    def test_keys_keep_insertion_order_like_dict_update(self):
+        merged = self.base.merge({"timeout": "60"}).merge({"retries": "1"})
+        expected = dict(self.base)
+        expected.update({"timeout": "60"})
+        expected.update({"retries": "1"})
+
+        self.assertEqual(list(expected.items()), list(merged.items()))
+        self.assertEqual(list(expected), list(merged))
+
+    def test_lookups(self):
+        merged = self.base.merge({"timeout": "60"})
+
+        self.assertEqual("echo 1", merged["command"])
+        self.assertEqual("60", merged.get("timeout"))
+        self.assertEqual(None, merged.get("missing"))
+        self.assertTrue("retries" in merged)
+        self.assertFalse("missing" in merged)
+        self.assertEqual(3, len(merged))
+        with self.assertRaises(KeyError):
+            merged["missing"]
+
+    def test_truthiness(self):
+        self.assertFalse(PersistentMap())
+        self.assertFalse(PersistentMap().merge({}))
+        self.assertTrue(PersistentMap().merge({"a": "1"}))
+
+    def test_long_chains_are_squashed_and_keep_sharing_the_base(self):
+        merged = self.base
+        for number in range(PersistentMap.MAX_DEPTH * 3):
+            merged = merged.merge({"command.{}".format(number): "echo"})
+
+        layer = merged
+        while layer._parent is not None:
+            layer = layer._parent
+        self.assertIs(self.base, layer)
+        self.assertTrue(merged._depth <= PersistentMap.MAX_DEPTH)
+        self.assertEqual(PersistentMap.MAX_DEPTH * 3 + 2, len(merged))
+        self.assertEqual("echo", merged["command.0"])
+
+    def test_repr_is_the_dict_repr(self):
+        merged = self.base.merge({"timeout": "60"})
+
+        self.assertEqual(repr(merged.as_dict()), repr(merged))
+
+    def test_pickle_and_deepcopy(self):
+        merged = self.base.merge({"timeout": "60"})
+
+        self.assertEqual(merged, pickle.loads(pickle.dumps(merged)))
+        self.assertEqual(merged, copy.deepcopy(merged))
+
+    def test_freeze(self):
+        self.assertIs(self.base, freeze(self.base))
+        self.assertEqual(PersistentMap(), freeze(None))
+        self.assertEqual({"a": "1"}, freeze({"a": "1"}))
+
+
+class JobBuilderSharingTest(TestCase):
+
+    def test_v1_derived_jobs_share_the_template_extra(self):
+        template = V1Command().with_(**{str(n): "x" for n in range(100)})
+        job = template.with_name("job").with_command("echo 1")
+
+        self.assertIs(template.extra, job.extra._parent)
+        self.assertEqual("echo 1", job.extra["command"])
+        self.assertFalse("command" in template.extra)
+
+    def test_v2_derived_jobs_share_the_template_extra_and_config(self):
+        template = V2Command(config={"retries": "3"}).with_(timeout="60")
+        job = template.with_name("job").with_command("echo 1")
+
+        self.assertIs(template.config, job.config)
+        self.assertIs(template.extra, job.extra._parent)
+        self.assertFalse("command" in template.extra)
@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from auror_core import Project
+from auror_core.graph import InvalidFlowError
+from auror_core.v1.job import Command as V1Command
+from auror_core.v2.job import Command
+from auror_core.v2.params import Params
+
+
+class ProjectTest(TestCase):
+
+    def setUp(self):
+        self.jobs = (
+            Command().with_name("job1").with_command("echo 1"),
+            Command().with_name("job2").with_command("echo 2"),
+        )
+        self.project = Project("folder", *self.jobs)
+
+    def test_default_project(self):
+        self.assertEqual("folder", self.project.folder)
+        self.assertEqual(self.jobs, self.project.jobtypes)
+        self.assertEqual((), self.project.params)
+        self.assertEqual(1, self.project.version)
+
+    def test_is_v2_returns_a_new_project_sharing_the_jobs(self):
+        project = self.project.is_v2()
+
+        self.assertEqual(2, project.version)
+        self.assertEqual(1, self.project.version)
+        self.assertIsNot(self.project, project)
+        self.assertIs(self.project.jobtypes, project.jobtypes)
+        self.assertIs(self.jobs[0], project.jobtypes[0])
+
+    def test_is_v1_returns_a_new_project(self):
+        project = self.project.is_v2().is_v1()
+
+        self.assertEqual(1, project.version)
+        self.assertIs(self.project.jobtypes, project.jobtypes)
+
+    def test_with_params_returns_a_new_project_sharing_the_params(self):
+        params = Params(variable="my variable")
+        project = self.project.is_v2().with_params(params)
+
+        self.assertEqual((params,), project.params)
+        self.assertIs(params, project.params[0])
+        self.assertEqual(2, project.version)
+        self.assertEqual((), self.project.params)
+        self.assertIs(self.project.jobtypes, project.jobtypes)
+
+    def test_builders_called_as_statements_do_not_change_the_project(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        project = Project(
+            folder, V1Command().with_name("job1").with_command("echo 1"))
+
+        project.is_v2()
+        project.with_params(Params(variable="my variable"))
+        report = project.write()
+
+        self.assertEqual(["job1.job"], report.written)
+        self.assertEqual(["job1.job"], os.listdir(folder))
+
+
+class ProjectValidationTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        first = Command().with_name("first").with_command("echo 1")
+        self.jobs = (
+            first.with_dependencies("second"),
+            Command().with_name("second").with_dependencies(first),
+            Command().with_name("third").with_dependencies("missing"),
+        )
+        self.project = Project(self.folder, *self.jobs)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_graph_indexes_the_project_jobs(self):
+        graph = self.project.graph()
+
+        self.assertEqual(["first", "second", "third"], list(graph.jobs))
+        self.assertIs(self.jobs[1], graph["second"])
+
+    def test_write_fails_before_writing_any_file(self):
+        for project in (self.project, self.project.is_v2()):
+            with self.assertRaises(InvalidFlowError) as context:
+                project.write()
+            self.assertEqual([
+                "job 'third' depends on unknown job 'missing'",
+                "dependency cycle 'second' -> 'first' -> 'second'",
+            ], context.exception.errors)
+            self.assertEqual([], os.listdir(self.folder))
+
+        with self.assertRaises(InvalidFlowError):
+            self.project.to_zip_bytes()
+
+    def test_validation_can_be_skipped(self):
+        name = os.path.basename(self.folder)
+        report = self.project.is_v2().write(validate=False)
+
+        self.assertEqual(
+            ["{}.flow".format(name), "flow20.project"], report.written)
+
+
+class PluginJobTypesTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def read(self, name):
+        with open(os.path.join(self.folder, name)) as f:
+            return f.read()
+
+    def test_v1_add_items_overrides_are_written(self):
+        from auror_core.v1.job import Job
+
+        class Email(Job):
+            _type = "email"
+
+            def _add_items(self):
+                super(Email, self)._add_items()
+                self.properties["mail.to"] = "a@b.c"
+
+        Project(self.folder, Job().as_type(Email).with_name("mail")).write()
+
+        self.assertEqual(
+            "#mail.job\nmail.to=a@b.c\ntype=email\n", self.read("mail.job"))
+
+    def test_v2_get_node_overrides_are_written(self):
+        from auror_core.v2.job import Job
+
+        class Spark(Job):
+            _type = "spark"
+
+            def _get_node(self, job):
+                node = super(Spark, self)._get_node(job)
+                node["config"]["spark.master"] = "yarn"
+                return node
+
+        Project(self.folder, Spark(name="spark")).is_v2().write()
+
+        self.assertTrue("spark.master: yarn" in self.read(
+            "{}.flow".format(os.path.basename(self.folder))))
@@ -0,0 +1,160 @@
+import os
+import shutil
+import socket
+import tempfile
+import time
+
+from unittest import TestCase
+
+import mock
+
+from auror_core import Project
+from auror_core.stats import WriteStats, LoggingSink, StatsdSink
+from auror_core.v1.job import Job, Command
+from auror_core.v1.params import Params
+from auror_core.v2.job import Command as V2Command
+from auror_core.v2.params import Env as V2Env
+
+
+class Slow(Job):
+    _type = "slow"
+
+    def before_add_hook(self):
+        time.sleep(0.05)
+        return super(Slow, self).before_add_hook()
+
+
+class WriteStatsTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.first = Command().with_name("first").with_command("echo 1")
+        self.second = Command().with_name("second").with_command("echo 2") \
+            .with_dependencies(self.first)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_v1_write(self):
+        stats = WriteStats()
+        slow = Job().as_type(Slow).with_name("slow").with_dependencies("first")
+
+        report = Project(self.folder, self.first, self.second, slow) \
+            .with_params(Params("params", user="hadoop")) \
+            .write(stats=stats)
+
+        sizes = sum(
+            os.path.getsize(os.path.join(self.folder, name))
+            for name in report.written)
+        self.assertEqual(4, stats.files_produced)
+        self.assertEqual(4, stats.files_written)
+        self.assertEqual(sizes, stats.bytes_written)
+        self.assertEqual(
+            set(["validate", "prepare", "serialize", "write"]),
+            set(stats.phases))
+        self.assertTrue(stats.phases["prepare"] >= 0.05)
+        self.assertTrue(stats.phases["write"] < 0.05)
+        self.assertEqual((u"slow", u"slow"), stats.slowest(1)[0][1:])
+        self.assertEqual(2, stats.job_types["command"]["count"])
+        self.assertEqual(1, stats.job_types["Params"]["count"])
+
+    def test_unchanged_files_are_not_counted_as_written(self):
+        project = Project(self.folder, self.first, self.second)
+        project.write(incremental=True)
+        stats = WriteStats()
+
+        project.write(incremental=True, stats=stats)
+
+        self.assertEqual(2, stats.files_produced)
+        self.assertEqual(0, stats.files_written)
+        self.assertEqual(0, stats.bytes_written)
+
+    def test_v2_write(self):
+        stats = WriteStats()
+        first = V2Command().with_name("first").with_command("echo 1")
+        flow = V2Command().with_name("flow").with_command("echo") \
+            .with_nodes(first)
+
+        Project(self.folder, flow).with_params(V2Env(USER="hadoop")) \
+            .is_v2().write(stats=stats)
+
+        self.assertEqual(2, stats.files_produced)
+        self.assertEqual(2, stats.job_types["command"]["count"])
+        self.assertTrue(stats.phases["serialize"] > 0)
+
+    def test_zip(self):
+        stats = WriteStats()
+
+        content = Project("project", self.first).to_zip_bytes(stats=stats)
+
+        self.assertTrue(content)
+        self.assertEqual(1, stats.files_written)
+
+    def test_nested_phases_are_timed_exclusively(self):
+        stats = WriteStats()
+
+        with stats.time("write"):
+            with stats.time("serialize", self.first):
+                time.sleep(0.05)
+
+        self.assertTrue(stats.phases["serialize"] >= 0.05)
+        self.assertTrue(stats.phases["write"] < 0.05)
+        self.assertEqual(stats.phases["serialize"], stats.jobs[("command", "first")])
+
+    def test_sinks_are_called_once_written(self):
+        sink = mock.Mock()
+        stats = WriteStats(sink)
+
+        Project(self.folder, self.first).write(stats=stats)
+
+        sink.assert_called_once_with(stats)
+
+
+class SinksTest(TestCase):
+
+    def setUp(self):
+        self.stats = WriteStats()
+        self.stats.add("prepare", 0.25, Command().with_name("job"))
+        self.stats.files_produced = 3
+        self.stats.bytes_written = 120
+
+    def test_logging_sink(self):
+        logger = mock.Mock()
+
+        LoggingSink(logger, level=10)(self.stats)
+
+        self.assertEqual(2, logger.log.call_count)
+        self.assertEqual(10, logger.log.call_args_list[0][0][0])
+        self.assertEqual(("job", "command", 0.25), logger.log.call_args_list[1][0][2:])
+
+    def test_statsd_sink_sends_udp_lines(self):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(listener.close)
+        listener.bind(("127.0.0.1", 0))
+        listener.settimeout(5)
+
+        StatsdSink("127.0.0.1", listener.getsockname()[1], "auror")(self.stats)
+
+        lines = listener.recv(4096).decode("utf-8").split("\n")
+        self.assertTrue("auror.phase.prepare:250.000|ms" in lines)
+        self.assertTrue("auror.job_type.command:250.000|ms" in lines)
+        self.assertTrue("auror.files:3|c" in lines)
+        self.assertTrue("auror.bytes:120|c" in lines)
+
+    def test_statsd_lines_are_split_in_small_packets(self):
+        sink = StatsdSink(prefix="auror")
+        sink.MAX_PACKET = 40
+        sent = []
+
+        with mock.patch("socket.socket") as mock_socket:
+            mock_socket.return_value.sendto.side_effect = \
+                lambda packet, address: sent.append(packet.decode("utf-8"))
+            sink(self.stats)
+
+        self.assertTrue(len(sent) > 1)
+        self.assertEqual(sink.lines(self.stats), "\n".join(sent).split("\n"))
+
+    def test_statsd_sink_never_fails(self):
+        with mock.patch("socket.socket") as mock_socket:
+            mock_socket.return_value.sendto.side_effect = socket.error("down")
+            StatsdSink()(self.stats)
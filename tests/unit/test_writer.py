@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from unittest import TestCase
+
+from auror_core import writer
+from auror_core.writer import SerialWriter, ThreadedWriter
+
+
+class WriterBackendTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.entries = [
+            ("file_{}.job".format(number), "content {}".format(number).encode())
+            for number in range(50)
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def read(self, name):
+        with open(os.path.join(self.folder, name), "rb") as f:
+            return f.read()
+
+    def assertWritten(self):
+        self.assertEqual(
+            sorted(name for name, _ in self.entries),
+            sorted(os.listdir(self.folder)))
+        for name, data in self.entries:
+            self.assertEqual(data, self.read(name))
+
+    def test_serial_writer(self):
+        SerialWriter().write(self.folder, iter(self.entries))
+        self.assertWritten()
+
+    def test_atomic_serial_writer_replaces_existing_files(self):
+        with open(os.path.join(self.folder, "file_0.job"), "wb") as f:
+            f.write(b"old content that is longer")
+
+        SerialWriter(atomic=True).write(self.folder, iter(self.entries))
+
+        self.assertWritten()
+
+    def test_threaded_writer(self):
+        ThreadedWriter(workers=4).write(self.folder, iter(self.entries))
+        self.assertWritten()
+
+    def test_threaded_writer_overlaps_slow_writes(self):
+        write_file = writer._write_file
+        running = []
+        overlapping = []
+
+        def slow_write_file(folder, name, data):
+            running.append(name)
+            overlapping.append(len(running))
+            time.sleep(0.01)
+            running.remove(name)
+            write_file(folder, name, data)
+
+        writer._write_file = slow_write_file
+        try:
+            ThreadedWriter(workers=5).write(self.folder, iter(self.entries))
+        finally:
+            writer._write_file = write_file
+
+        self.assertWritten()
+        self.assertTrue(1 < max(overlapping) <= 5)
+
+    def test_threaded_writer_needs_a_worker(self):
+        for workers in (0, -1):
+            with self.assertRaises(ValueError) as context:
+                ThreadedWriter(workers=workers)
+            self.assertTrue("at least 1" in str(context.exception))
+
+    def test_threaded_writer_raises_the_first_error(self):
+        entries = self.entries + [("missing/file.job", b"content")]
+
+        with self.assertRaises(IOError):
+            ThreadedWriter(workers=4).write(self.folder, iter(entries))
+        self.assertFalse(any(
+            name.endswith(".tmp") for name in os.listdir(self.folder)))
+
+    def test_threaded_writer_stops_all_threads(self):
+        before = threading.active_count()
+        ThreadedWriter(workers=4).write(self.folder, iter(self.entries))
+        self.assertEqual(before, threading.active_count())
@@ -39,7 +39,7 @@ class JobTest(TestCase):
     def test_with_dependencies(self):
         data_job = Job("test_job_name_2", ["test_job_name_2"], {"driver.memory": "5g"})
         content = self.data_job.with_dependencies(data_job)
-        expected = ["test_job_name_2"]
+        expected = ("test_job_name_2",)
         actual = content.dependencies
 
         self.assertEqual(expected, actual)
@@ -86,7 +86,7 @@ class JobTest(TestCase):
         content = data_job_x.as_type(Command)
         content._add_items()
 
-        self.assertEqual([], content.dependencies)
+        self.assertEqual((), content.dependencies)
         self.assertEqual("command", content.properties["type"])
 
 
@@ -126,4 +126,122 @@ class CommandJobTest(TestCase):
                     'command.1': "${python} -c 'from teste import teste_command_spark_again; teste_command_spark_again()'"}
 
         self.assertEqual('command', result._type)
-        self.assertEqual(expected, actual)
\ No newline at end of file
+        self.assertEqual(expected, actual)
+
+    def test_with_commands(self):
+        result = Command().with_commands(["COMMAND", "COMMAND 2", "COMMAND 3"])
+        expected = {"command": "COMMAND", "command.1": "COMMAND 2", "command.2": "COMMAND 3"}
+
+        self.assertEqual(expected, result.extra)
+
+    def test_with_commands_is_the_same_as_chaining_with_another_command(self):
+        commands = ["COMMAND {}".format(number) for number in range(20)]
+        chained = Command()
+        for command in commands:
+            chained = chained.with_another_command(command)
+
+        self.assertEqual(chained.extra, Command().with_commands(commands).extra)
+
+    def test_with_another_command_fills_gaps(self):
+        result = Command().with_command("COMMAND") \
+            .with_(**{"command.2": "COMMAND 3"}) \
+            .with_another_command("COMMAND 2") \
+            .with_another_command("COMMAND 4")
+        expected = {"command": "COMMAND", "command.1": "COMMAND 2", "command.2": "COMMAND 3", "command.3": "COMMAND 4"}
+
+        self.assertEqual(expected, result.extra)
+
+
+class CompactJobTest(TestCase):
+
+    def test_jobs_have_no_instance_dict(self):
+        job = Command().with_name("a").with_command("echo").with_another_command("echo 2")
+
+        self.assertFalse(hasattr(job, "__dict__"))
+
+    def test_dependencies_are_interned_tuples(self):
+        first = Command().with_dependencies("".join(["other", "_job"]))
+        second = Command().with_dependencies("".join(["other", "_", "job"]))
+
+        self.assertEqual(("other_job",), first.dependencies)
+        self.assertIs(first.dependencies[0], second.dependencies[0])
+
+    def test_properties_are_only_allocated_on_add_items(self):
+        job = Command().with_name("a").with_command("echo")
+
+        self.assertEqual("#a.job\ncommand=echo\ntype=command\n", job._dumps())
+        self.assertIsNone(job._properties)
+        job._add_items()
+        self.assertEqual({"command": "echo", "type": "command"}, job.properties)
+
+    def test_plugin_job_types_without_slots(self):
+        class Email(Job):
+            _type = "email"
+
+        job = Job().as_type(Email).with_name("mail").with_(to="a@b.c")
+        job.custom = "value"
+
+        self.assertEqual("#mail.job\nto=a@b.c\ntype=email\n", job._dumps())
+
+
+class FanOutTest(TestCase):
+
+    def setUp(self):
+        self.root = Command().with_name("root").with_command("echo root")
+        self.template = Command().with_command("run ${date}") \
+            .with_(retries="3").with_dependencies("start")
+
+    def test_one_job_per_row(self):
+        jobs = self.template.fan_out([
+            {"name": "first", "date": "2020-01-01"},
+            {"name": "second", "date": "2020-01-02", "retries": "5"},
+        ])
+
+        self.assertEqual(["first", "second"], [job.name for job in jobs])
+        self.assertTrue(all(isinstance(job, Command) for job in jobs))
+        self.assertEqual(
+            {"command": "run ${date}", "retries": "5", "date": "2020-01-02"},
+            jobs[1].extra)
+
+    def test_rows_can_replace_the_dependencies(self):
+        dependencies = [self.root, "other"]
+        jobs = self.template.fan_out([
+            {"name": "first"},
+            {"name": "second", "dependencies": dependencies},
+            {"name": "third", "dependencies": dependencies},
+            {"name": "fourth", "dependencies": []},
+        ])
+
+        self.assertEqual(
+            [("start",), ("root", "other"), ("root", "other"), ()],
+            [job.dependencies for job in jobs])
+
+    def test_same_jobs_as_chaining(self):
+        rows = [{"name": "job_{}".format(number), "date": str(number),
+                 "dependencies": [self.root]} for number in range(5)]
+
+        expected = [
+            self.template.with_name(row["name"]).with_(date=row["date"])
+            .with_dependencies(self.root)._dumps()
+            for row in rows
+        ]
+
+        self.assertEqual(expected, [job._dumps() for job in self.template.fan_out(rows)])
+
+    def test_the_template_extra_is_shared(self):
+        job = self.template.fan_out([{"name": "first", "date": "today"}])[0]
+
+        self.assertIs(self.template.extra, job.extra._parent)
+
+    def test_plugin_job_types_overriding_add_items(self):
+        class Email(Job):
+            _type = "email"
+
+            def _add_items(self):
+                super(Email, self)._add_items()
+                self.properties["mail.to"] = "a@b.c"
+
+        job = Job().as_type(Email).with_name("mail")
+
+        self.assertEqual("#mail.job\nmail.to=a@b.c\ntype=email\n", job._dumps())
+        self.assertIsNone(job._properties)
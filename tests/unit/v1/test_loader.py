@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from auror_core import Project
+from auror_core.v1 import JobType
+from auror_core.v1.job import Job, Command, Flow
+from auror_core.v1.loader import Loader
+from auror_core.v1.params import Params, Env
+
+
+class LoaderTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def write(self, name, content):
+        with open(os.path.join(self.folder, name), "w") as f:
+            f.write(content)
+
+    def read_folder(self, folder):
+        files = dict()
+        for name in os.listdir(folder):
+            with open(os.path.join(folder, name)) as f:
+                files[name] = f.read()
+        return files
+
+    def test_error_on_inexistent_folder(self):
+        with self.assertRaises(ValueError) as context:
+            Loader("/this/does/not/exist")
+        self.assertTrue("Folder does not exists" in str(context.exception))
+
+    def test_jobs_are_built_by_type(self):
+        self.write("b.job", "type=command\ncommand=echo b\ndependencies=a, c\n")
+        self.write("a.job", "type=command\ncommand=echo a\n")
+        self.write("c.job", "type=flow\nflow.name=other\n")
+
+        jobs = Loader(self.folder).as_job_objects()
+
+        self.assertEqual(["a", "b", "c"], [job.name for job in jobs])
+        self.assertEqual([Command, Command, Flow], [type(job) for job in jobs])
+        self.assertEqual(("a", "c"), jobs[1].dependencies)
+        self.assertEqual({"command": "echo b"}, jobs[1].extra)
+        self.assertEqual({"flow.name": "other"}, jobs[2].extra)
+
+    def test_numbered_commands_keep_their_numbers(self):
+        self.write("a.job", "type=command\ncommand=one\ncommand.2=three\n")
+
+        job = Loader(self.folder).as_job_objects()[0] \
+            .with_another_command("two").with_another_command("four")
+
+        self.assertEqual(
+            {"command": "one", "command.1": "two",
+             "command.2": "three", "command.3": "four"},
+            job.extra)
+
+    def test_plugin_job_types_keep_their_type(self):
+        self.write("mail.job", "type=email\nto=a@b.c\n")
+
+        job = Loader(self.folder).as_job_objects()[0]
+
+        self.assertIsInstance(job, Job)
+        self.assertIs(JobType.get_job_type_class("email"), type(job))
+        self.assertEqual("#mail.job\nto=a@b.c\ntype=email\n", job._dumps())
+
+    def test_plugin_job_types_can_be_pickled(self):
+        import pickle
+
+        self.write("spark.job", "type=spark\nspark.master=yarn\ndependencies=a\n")
+        job = Loader(self.folder).as_job_objects()[0]
+
+        loaded = pickle.loads(pickle.dumps(job, pickle.HIGHEST_PROTOCOL))
+
+        self.assertIs(type(job), type(loaded))
+        self.assertEqual(job._dumps(), loaded._dumps())
+
+    def test_plugin_job_types_in_write_projects(self):
+        from auror_core.batch import write_projects
+
+        self.write("spark.job", "type=spark\nspark.master=yarn\n")
+        other = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other, True)
+
+        results = write_projects([Loader(self.folder).as_project(other)], workers=1)
+
+        self.assertEqual(None, results[0].error)
+        self.assertEqual(
+            {"spark.job": "#spark.job\nspark.master=yarn\ntype=spark\n"},
+            self.read_folder(other))
+
+    def test_params_and_env(self):
+        self.write("params.properties", "name=my name\nretries=3\n")
+        self.write("env.properties", "env.USER=hadoop\n")
+
+        params = Loader(self.folder).as_params()
+
+        self.assertEqual(["env", "params"], [param.name for param in params])
+        self.assertEqual([Env, Params], [type(param) for param in params])
+        self.assertEqual({"USER": "hadoop"}, params[0].key_vals)
+        self.assertEqual({"name": "my name", "retries": "3"}, params[1].key_vals)
+
+    def test_as_flow(self):
+        self.write("a.job", "type=command\ncommand=echo a\n")
+        self.write("b.job", "type=command\ncommand=echo b\ndependencies=a\n")
+
+        flow = Loader(self.folder).as_flow()
+
+        self.assertEqual(["b"], flow.dependents["a"])
+
+    def test_project_round_trip(self):
+        first = Command().with_command("echo 1").with_another_command("echo 2")
+        jobs = [
+            first.with_name("first").with_(**{"key with=special": "é \\"}),
+            first.with_name("second").with_dependencies("first"),
+            Job().as_type(Flow).with_name("end").with_dependencies("first", "second"),
+        ]
+        Project(self.folder, *jobs).with_params(
+            Params("params", retries="3"), Env("env", USER="hadoop")).write()
+        other = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other, True)
+
+        Loader(self.folder).as_project(other).write()
+
+        self.assertEqual(self.read_folder(self.folder), self.read_folder(other))
+
+    def test_files_are_parsed_by_a_pool_of_workers(self):
+        jobs = [
+            Command().with_name("job_{}".format(number)).with_command("echo")
+            for number in range(20)
+        ]
+        Project(self.folder, *jobs).write()
+        serial = Loader(self.folder, workers=1)
+        serial.CHUNK_SIZE = 3
+        pooled = Loader(self.folder, workers=2)
+        pooled.CHUNK_SIZE = 3
+
+        self.assertEqual(
+            [job._dumps() for job in serial.as_job_objects()],
+            [job._dumps() for job in pooled.as_job_objects()])
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import random
+
+from unittest import TestCase
+
+import javaproperties
+
+from auror_core.v1 import properties
+
+
+class PropertiesTest(TestCase):
+
+    def assertSameAsJavaproperties(self, values, comment=u"job.job"):
+        expected = javaproperties.dumps(
+            values, comments=comment, timestamp=False, sort_keys=True)
+        self.assertEqual(expected, properties.dumps(values, comment))
+
+    def test_plain_values(self):
+        self.assertSameAsJavaproperties({
+            u"type": u"command",
+            u"command": u"bash run.sh --date ${date}",
+            u"dependencies": u"a,b,c",
+        })
+
+    def test_empty_properties(self):
+        self.assertSameAsJavaproperties({})
+
+    def test_special_characters(self):
+        self.assertSameAsJavaproperties({
+            u"key with spaces": u"  leading spaces and trailing  ",
+            u"sep=ar:ators": u"a=b:c # not a comment ! really",
+            u"back\\slash": u"C:\\path\\to\\file",
+            u"control": u"tab\there\nnew line\rcarriage\fform feed",
+            u"unicode": u"caf\xe9 \u20ac \U0001F600",
+            u"": u"",
+            u" ": u" ",
+        })
+
+    def test_comments(self):
+        for comment in [
+                u"params.properties",
+                u"multi\r\nline\rcomment\n#kept\n!kept",
+                u"caf\xe9 \u20ac.job",
+        ]:
+            self.assertSameAsJavaproperties({u"a": u"b"}, comment)
+
+    def test_sorted_keys(self):
+        values = dict(
+            (u"command.{}".format(number), u"echo {}".format(number))
+            for number in range(20))
+        self.assertSameAsJavaproperties(values)
+
+    def test_random_values(self):
+        generator = random.Random(13)
+        alphabet = u" \t\n\r\f!#:=\\abcXYZ019.-_$%{}\x00\x7f\xe9\u20ac\U0001F600"
+        for _ in range(200):
+            values = dict(
+                (u"".join(generator.choice(alphabet) for _ in range(8)),
+                 u"".join(generator.choice(alphabet) for _ in range(20)))
+                for _ in range(5))
+            self.assertSameAsJavaproperties(values)
+
+    def test_non_text_values_behave_like_javaproperties(self):
+        with self.assertRaises(TypeError):
+            javaproperties.dumps(
+                {u"retries": 3}, comments=u"a", timestamp=False)
+        with self.assertRaises(TypeError):
+            properties.dumps({u"retries": 3}, u"a")
+
+
+class LoadsTest(TestCase):
+
+    def assertLoadsLikeJavaproperties(self, text):
+        self.assertEqual(javaproperties.loads(text), properties.loads(text))
+
+    def test_separators_and_whitespace(self):
+        for text in [u"a=b\n", u"a = b \n", u"  a:b", u"a b c", u"a\t=\t b",
+                     u"a==b", u"a:=b", u"=b", u"a\x0c b", u"a\n"]:
+            self.assertLoadsLikeJavaproperties(text)
+
+    def test_comments_blank_lines_and_line_breaks(self):
+        self.assertLoadsLikeJavaproperties(
+            u"#job.job\n! other\n\n  \t\na=b\r\nc=d\re=f\na=last")
+
+    def test_escapes_and_continuation_lines(self):
+        self.assertLoadsLikeJavaproperties(
+            u"key\\ with\\ spaces=\\u00e9t\\u00e9\\\n    continued\n")
+
+    def test_dumps_round_trip(self):
+        generator = random.Random(21)
+        alphabet = u" \t\n\r\f!#:=\\abcXYZ019.-_$%{}\x00\x7f\xe9\u20ac"
+        for _ in range(200):
+            values = dict(
+                (u"".join(generator.choice(alphabet) for _ in range(8)),
+                 u"".join(generator.choice(alphabet) for _ in range(20)))
+                for _ in range(5))
+            self.assertEqual(
+                values, properties.loads(properties.dumps(values, u"a")))
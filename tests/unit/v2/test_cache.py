@@ -0,0 +1,176 @@
+import os
+import shutil
+import tempfile
+
+import mock
+
+from unittest import TestCase
+
+from auror_core.v2.cache import FlowCache
+from auror_core.v2.loader import Loader
+
+
+FLOW = (
+    'nodes:\n'
+    '- name: first\n'
+    '  type: command\n'
+    '  config:\n'
+    '    command: echo 1\n'
+    '- name: embedded\n'
+    '  type: command\n'
+    '  dependsOn:\n'
+    '  - first\n'
+    '  config:\n'
+    '    command: echo 2\n'
+    '  nodes:\n'
+    '  - name: inner\n'
+    '    type: command\n'
+    '    config:\n'
+    '      command: echo 3\n'
+)
+
+
+class FlowCacheTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.test_dir, 'cache')
+        self.cache = FlowCache(self.cache_dir, max_entries=2)
+        self.flow_path = self.write_flow('flow.flow', FLOW)
+        self.builds = []
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_flow(self, name, content):
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w') as flow:
+            flow.write(content)
+        return path
+
+    def build(self, value='built'):
+        def build():
+            self.builds.append(value)
+            return [value]
+        return build
+
+    def test_repeated_loads_are_built_once(self):
+        self.assertEqual(['built'], self.cache.get_or_build(
+            self.flow_path, self.build()))
+        self.assertEqual(['built'], self.cache.get_or_build(
+            self.flow_path, self.build('again')))
+        self.assertEqual(['built'], self.builds)
+
+    def test_changed_file_is_built_again(self):
+        self.cache.get_or_build(self.flow_path, self.build())
+        self.write_flow('flow.flow', FLOW + '- name: other\n')
+
+        self.assertEqual(['again'], self.cache.get_or_build(
+            self.flow_path, self.build('again')))
+
+    def test_touched_file_with_the_same_content_is_a_hit(self):
+        self.cache.get_or_build(self.flow_path, self.build())
+        os.utime(self.flow_path, (0, 0))
+        self.write_flow('flow.flow', FLOW)
+
+        self.cache.get_or_build(self.flow_path, self.build('again'))
+        self.cache.get_or_build(self.flow_path, self.build('again'))
+
+        self.assertEqual(['built'], self.builds)
+
+    def age_entries(self):
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            mtime = os.path.getmtime(entry) - 10
+            os.utime(entry, (mtime, mtime))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        paths = [
+            self.write_flow('flow_{}.flow'.format(number), FLOW)
+            for number in range(3)
+        ]
+        self.cache.get_or_build(paths[0], self.build())
+        self.age_entries()
+        self.cache.get_or_build(paths[1], self.build())
+        self.age_entries()
+        self.cache.get_or_build(paths[0], self.build('hit'))
+        self.age_entries()
+
+        self.cache.get_or_build(paths[2], self.build())
+
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+        self.cache.get_or_build(paths[0], self.build('hit'))
+        self.cache.get_or_build(paths[1], self.build('evicted'))
+        self.assertEqual(['built', 'built', 'built', 'evicted'], self.builds)
+
+    def test_broken_entries_are_built_again(self):
+        self.cache.get_or_build(self.flow_path, self.build())
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'wb') as entry:
+                entry.write(b'broken')
+
+        self.assertEqual(['again'], self.cache.get_or_build(
+            self.flow_path, self.build('again')))
+
+    def test_headers_without_every_field_are_a_miss(self):
+        import pickle
+
+        self.cache.get_or_build(self.flow_path, self.build())
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'wb') as entry:
+                pickle.dump({'version': FlowCache.VERSION,
+                             'size': os.path.getsize(self.flow_path)}, entry)
+                pickle.dump(['stale'], entry)
+
+        self.assertEqual(['again'], self.cache.get_or_build(
+            self.flow_path, self.build('again')))
+
+    def test_corrupted_entries_never_fail_a_load(self):
+        import random
+
+        Loader(self.flow_path, cache=self.cache).as_job_objects()
+        entry = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(entry, 'rb') as f:
+            original = bytearray(f.read())
+        generator = random.Random(7)
+
+        for _ in range(300):
+            corrupted = bytearray(original)
+            for _ in range(generator.randint(1, 4)):
+                corrupted[generator.randrange(len(corrupted))] = \
+                    generator.randrange(256)
+            with open(entry, 'wb') as f:
+                f.write(bytes(corrupted[:generator.randint(1, len(corrupted))]))
+
+            jobs = Loader(self.flow_path, cache=self.cache).as_job_objects()
+
+            self.assertEqual(2, len(jobs))
+
+    def test_clear(self):
+        self.cache.get_or_build(self.flow_path, self.build())
+        self.cache.clear()
+
+        self.assertEqual([], os.listdir(self.cache_dir))
+
+    def test_loader_with_cache(self):
+        expected = Loader(self.flow_path).as_job_objects()
+        Loader(self.flow_path, cache=self.cache).as_job_objects()
+
+        with mock.patch('auror_core.v2.yaml_backend') as mock_yaml:
+            jobs = Loader(self.flow_path, cache=self.cache).as_job_objects()
+
+        self.assertFalse(mock_yaml.load.called)
+        self.assertEqual(expected, jobs)
+        self.assertEqual('inner', jobs[1].nodes[0].name)
+
+    def test_loader_with_cache_keeps_plugin_job_types(self):
+        path = self.write_flow('spark.flow', FLOW.replace(
+            'name: first\n  type: command', 'name: first\n  type: spark'))
+        expected = Loader(path).as_job_objects()
+        Loader(path, cache=self.cache).as_job_objects()
+
+        jobs = Loader(path, cache=self.cache).as_job_objects()
+
+        self.assertEqual(expected, jobs)
+        self.assertIs(type(expected[0]), type(jobs[0]))
+        self.assertEqual('spark', jobs[0]._type)
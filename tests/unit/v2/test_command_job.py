@@ -79,3 +79,50 @@ class CommandJobTest(TestCase):
         ])
 
         self.assertEqual(expected_job, actual_job)
+
+    def test_with_commands(self):
+        result = Command().with_commands(['COMMAND', 'COMMAND 2', 'COMMAND 3'])
+        expected = {'command': 'COMMAND', 'command.1': 'COMMAND 2', 'command.2': 'COMMAND 3'}
+
+        self.assertEqual(expected, result.extra)
+
+    def test_with_commands_is_the_same_as_chaining_with_another_command(self):
+        commands = ['COMMAND {}'.format(number) for number in range(20)]
+        chained = Command()
+        for command in commands:
+            chained = chained.with_another_command(command)
+
+        self.assertEqual(chained, Command().with_commands(commands))
+
+    def test_with_commands_ignores_empty_commands(self):
+        result = Command().with_commands(['COMMAND', '', None, 'COMMAND 2'])
+        expected = {'command': 'COMMAND', 'command.1': 'COMMAND 2'}
+
+        self.assertEqual(expected, result.extra)
+
+    def test_with_another_command_fills_gaps_left_by_build(self):
+        job = {
+            'config': {
+                'command': 'COMMAND',
+                'command.1': 'COMMAND 2',
+                'command.3': 'COMMAND 4',
+            },
+            'name': 'AZTest',
+        }
+        result = Command.build(job) \
+            .with_another_command('COMMAND 3') \
+            .with_another_command('COMMAND 5')
+
+        self.assertEqual('COMMAND 2', result.extra['command.1'])
+        self.assertEqual('COMMAND 3', result.extra['command.2'])
+        self.assertEqual('COMMAND 4', result.extra['command.3'])
+        self.assertEqual('COMMAND 5', result.extra['command.4'])
+
+    def test_with_another_commands_keeps_explicit_numbers(self):
+        result = Command().with_command('COMMAND').with_another_commands([
+            Command._Command('COMMAND 3', '3'),
+            Command._Command('COMMAND 2', None),
+        ])
+        expected = {'command': 'COMMAND', 'command.3': 'COMMAND 3', 'command.1': 'COMMAND 2'}
+
+        self.assertEqual(expected, result.extra)
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from auror_core import Project
+from auror_core.v1 import job as v1_job, params as v1_params
+from auror_core.v2 import job as v2_job, params as v2_params
+from auror_core.v2.converter import convert
+
+
+def build(job, params):
+    first = job.Command().with_name("first") \
+        .with_command("echo 'a: b'") \
+        .with_another_command("run " * 30)
+    second = job.Command().with_name("second") \
+        .with_command("echo 2").with_(retries="3") \
+        .with_dependencies(first)
+    return [first, second], [
+        params.Params("params", retries="1", date="today"),
+        params.Env("env", USER="hadoop"),
+    ]
+
+
+class ConvertTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.test_dir, "v1")
+        self.destination = os.path.join(self.test_dir, "v2")
+        os.mkdir(self.source)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def read(self, folder):
+        files = dict()
+        for name in os.listdir(folder):
+            with open(os.path.join(folder, name)) as f:
+                files[name] = f.read()
+        return files
+
+    def test_same_files_as_a_v2_project(self):
+        jobs, params = build(v1_job, v1_params)
+        Project(self.source, *jobs).with_params(*params).write()
+        expected = os.path.join(self.test_dir, "expected", "v2")
+        os.makedirs(expected)
+        jobs, params = build(v2_job, v2_params)
+        Project(expected, *jobs).with_params(*params).is_v2().write()
+
+        report = convert(self.source, self.destination)
+
+        self.assertEqual(["v2.flow", "flow20.project"], report.written)
+        self.assertEqual(self.read(expected), self.read(self.destination))
+
+    def test_params_are_folded_into_the_config(self):
+        Project(self.source, v1_job.Command().with_name("job").with_command("echo")) \
+            .with_params(v1_params.Params("a", x="1", y="1"),
+                         v1_params.Params("b", y="2")).write()
+
+        convert(self.source, self.destination)
+
+        self.assertTrue(self.read(self.destination)["v2.flow"].startswith(
+            "config:\n  x: '1'\n  y: '2'\nnodes:\n"))
+
+    def test_plugin_job_types_keep_their_type(self):
+        with open(os.path.join(self.source, "mail.job"), "w") as f:
+            f.write("type=email\nto=a@b.c\ndependencies=other\n")
+
+        convert(self.source, self.destination)
+
+        self.assertEqual(
+            "nodes:\n- config:\n    to: a@b.c\n  dependsOn:\n  - other\n"
+            "  name: mail\n  nodes: []\n  type: email\n",
+            self.read(self.destination)["v2.flow"])
+
+    def test_empty_project(self):
+        convert(self.source, self.destination)
+
+        self.assertEqual("{}\n", self.read(self.destination)["v2.flow"])
+
+    def test_error_on_inexistent_folder(self):
+        with self.assertRaises(ValueError):
+            convert(os.path.join(self.test_dir, "missing"), self.destination)
@@ -1,13 +1,20 @@
+import os
 import shutil
+import subprocess
+import sys
 import tempfile
 
-import autopep8
+from unittest import TestCase, skipUnless
 
-from unittest import TestCase
-
-from auror_core.v2.job import Command
+from auror_core.v2 import JobType
+from auror_core.v2.job import Job, Command
 from auror_core.v2.dumper import Dumper
 
+try:
+    import pycodestyle
+except ImportError:
+    pycodestyle = None
+
 
 class TestDumper(TestCase):
     
@@ -17,7 +24,19 @@ class TestDumper(TestCase):
     
     def tearDown(self):
         shutil.rmtree(self.tem_dir)
-    
+
+    def read_dumped_file(self):
+        with open('{}/flow.py'.format(self.tem_dir)) as _file:
+            return ''.join(_file.readlines())
+
+    def load_dumped_jobs(self):
+        namespace = dict()
+        exec(self.read_dumped_file(), namespace)
+        job_names = sorted(
+            (name for name in namespace if name.startswith('job_')),
+            key=lambda name: int(name.split('_')[-1]))
+        return [namespace[name] for name in job_names]
+
     def test_should_raise_an_exception_on_inexistence_directory(self):
         path = '/this/path/does/not/exist'
         with self.assertRaises(ValueError) as context:
@@ -33,18 +52,30 @@ class TestDumper(TestCase):
                 'command': 'pwd'
             }
         )
-        expected_file_content = autopep8.fix_code(
-            '{}job_0 = {}\n'.format(Dumper.DEFAULT_IMPORTS, repr(simple_job)),
-            options={
-                'aggressive': True,
-            }
-        )
+        expected_file_content = (
+            "{}job_0 = Command(\n"
+            "    name='shell_pwd',\n"
+            "    config={{'command': 'pwd'}},\n"
+            "    dependencies=[],\n"
+            "    nodes=[],\n"
+            "    extra={{}},\n"
+            ")\n"
+        ).format(Dumper.DEFAULT_IMPORTS)
 
         self.dumper.dump_jobs(simple_job)
 
-        with open('{}/flow.py'.format(self.tem_dir)) as _file:
-            file_content = ''.join(_file.readlines())
-        self.assertEqual(expected_file_content, file_content)
+        self.assertEqual(expected_file_content, self.read_dumped_file())
+        self.assertEqual([simple_job], self.load_dumped_jobs())
+
+    def test_dump_short_job_in_one_line(self):
+        job = Command(name='a')
+
+        self.dumper.dump_jobs(job)
+
+        self.assertEqual(
+            "{}job_0 = Command(name='a', config={{}}, dependencies=[], "
+            "nodes=[], extra={{}})\n".format(Dumper.DEFAULT_IMPORTS),
+            self.read_dumped_file())
     
     def test_dump_two_jobs(self):
         job = Command(
@@ -53,18 +84,13 @@ class TestDumper(TestCase):
                 'command': 'pwd'
             }
         )
-        expected_file_content = autopep8.fix_code(
-            '{}job_0 = {}\n\njob_1 = {}\n'.format(Dumper.DEFAULT_IMPORTS, repr(job), repr(job)),
-            options={
-                'aggressive': True,
-            }
-        )
 
         self.dumper.dump_jobs(job, job)
-        
-        with open('{}/flow.py'.format(self.tem_dir)) as _file:
-            file_content = ''.join(_file.readlines())
-        self.assertEqual(expected_file_content, file_content)
+
+        file_content = self.read_dumped_file()
+        self.assertTrue(file_content.startswith(Dumper.DEFAULT_IMPORTS))
+        self.assertTrue(')\n\njob_1 = Command(\n' in file_content)
+        self.assertEqual([job, job], self.load_dumped_jobs())
     
     def test_dump_embbed_job(self):
         internal_job = Command(
@@ -80,19 +106,28 @@ class TestDumper(TestCase):
             },
             nodes=[internal_job,]
         )
-
-        expected_file_content = autopep8.fix_code(
-            '{}job_0 = {}\n'.format(Dumper.DEFAULT_IMPORTS, repr(embbed_job)),
-            options={
-                'aggressive': True,
-            }
-        )
+        expected_file_content = (
+            "{}job_0 = Command(\n"
+            "    name='embedded_flow1',\n"
+            "    config={{'command': 'flow_command'}},\n"
+            "    dependencies=[],\n"
+            "    nodes=[\n"
+            "        Command(\n"
+            "            name='shell_pwd',\n"
+            "            config={{'command': 'pwd'}},\n"
+            "            dependencies=[],\n"
+            "            nodes=[],\n"
+            "            extra={{}},\n"
+            "        ),\n"
+            "    ],\n"
+            "    extra={{}},\n"
+            ")\n"
+        ).format(Dumper.DEFAULT_IMPORTS)
 
         self.dumper.dump_jobs(embbed_job)
-        
-        with open('{}/flow.py'.format(self.tem_dir)) as _file:
-            file_content = ''.join(_file.readlines())
-        self.assertEqual(expected_file_content, file_content)
+
+        self.assertEqual(expected_file_content, self.read_dumped_file())
+        self.assertEqual([embbed_job], self.load_dumped_jobs())
     
     def test_dump_one_embbed_job_and_one_simple_job(self):
         job = Command(
@@ -108,15 +143,170 @@ class TestDumper(TestCase):
             },
             nodes=[job,]
         )
-        expected_file_content = autopep8.fix_code(
-            '{}job_0 = {}\n\njob_1 = {}\n'.format(Dumper.DEFAULT_IMPORTS, repr(job), repr(embbed_job)),
-            options={
-                'aggressive': True,
-            }
-        )
 
         self.dumper.dump_jobs(job, embbed_job)
-        
+
+        self.assertEqual([job, embbed_job], self.load_dumped_jobs())
+
+    def test_dump_long_values_are_split(self):
+        job = Command(
+            name='long',
+            config={
+                'command': 'bash run.sh ' + ' '.join(['--option'] * 40),
+                'quoted': 'it\'s "quoted" \\ and\nmultiline',
+            },
+        ).with_dependencies(Command(name='a' * 90))
+
+        self.dumper.dump_jobs(job)
+
+        self.assertTrue(all(
+            len(line) <= 79 for line in self.read_dumped_file().splitlines()
+            if "'{}'".format('a' * 90) not in line))
+        self.assertEqual([job], self.load_dumped_jobs())
+
+    def test_dump_imports_every_job_type(self):
+        job = Command(name='flow', nodes=[Job(name='inner')])
+
+        self.dumper.dump_jobs(job)
+
+        self.assertTrue(self.read_dumped_file().startswith(
+            'from auror_core.v2.job import Command, Job\n\n\n'))
+        self.assertEqual([job], self.load_dumped_jobs())
+
+    def test_dump_plugin_job_types_as_commands(self):
+        job = JobType.get_job_type_class('spark')(
+            name='submit', config={'command': 'spark-submit'})
+
+        self.dumper.dump_jobs(job)
+
+        self.assertTrue(self.read_dumped_file().startswith(
+            'from auror_core.v2.job import Command\n\n\n'))
+        dumped = self.load_dumped_jobs()
+        self.assertIs(Command, type(dumped[0]))
+        self.assertEqual([job], dumped)
+
+    @skipUnless(pycodestyle, 'pycodestyle is not installed')
+    def test_dumped_file_is_pep8_clean(self):
+        job = Command(
+            name='shell_pwd',
+            config={'command': 'pwd', 'long': 'x ' * 100},
+        ).with_commands(['echo {}'.format(number) for number in range(5)])
+        embbed_job = Command(name='embedded_flow1', nodes=[job, job])
+
+        self.dumper.dump_jobs(job, embbed_job)
+
+        style = pycodestyle.StyleGuide(quiet=True)
+        report = style.check_files(['{}/flow.py'.format(self.tem_dir)])
+        self.assertEqual(0, report.total_errors)
+
+
+class TestDumperSharedBases(TestCase):
+
+    def setUp(self):
+        self.tem_dir = tempfile.mkdtemp()
+        self.dumper = Dumper(self.tem_dir, share_bases=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tem_dir)
+
+    def dump_and_load(self, *jobs):
+        self.dumper.dump_jobs(*jobs)
         with open('{}/flow.py'.format(self.tem_dir)) as _file:
-            file_content = ''.join(_file.readlines())
-        self.assertEqual(expected_file_content, file_content)
+            self.content = _file.read()
+        namespace = dict()
+        exec(self.content, namespace)
+        return [namespace['job_{}'.format(number)]
+                for number in range(len(jobs))]
+
+    def assertSameFlow(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for expected_job, actual_job in zip(expected, actual):
+            self.assertEqual(type(expected_job), type(actual_job))
+            self.assertEqual(expected_job.name, actual_job.name)
+            self.assertEqual(
+                list(expected_job.dependencies), list(actual_job.dependencies))
+            config = dict(expected_job.config)
+            config.update(expected_job.extra)
+            actual_config = dict(actual_job.config)
+            actual_config.update(actual_job.extra)
+            self.assertEqual(config, actual_config)
+            self.assertSameFlow(expected_job.nodes, actual_job.nodes)
+
+    def template(self):
+        return Command().with_command('bash run.sh').with_(**{
+            'retries': '3',
+            'env.SPARK_MASTER': 'yarn',
+        })
+
+    def test_shared_config_is_written_once(self):
+        root = self.template().with_name('root')
+        jobs = [root] + [
+            self.template().with_name('job_{}'.format(number))
+            .with_dependencies(root)
+            for number in range(5)
+        ]
+
+        loaded = self.dump_and_load(*jobs)
+
+        self.assertSameFlow(jobs, loaded)
+        self.assertEqual(1, self.content.count("'env.SPARK_MASTER'"))
+        self.assertIn(
+            "job_1 = base_0.with_name('job_0').with_dependencies('root')\n",
+            self.content)
+
+    def test_unique_values_are_added_to_the_base(self):
+        jobs = [
+            self.template().with_name('a').with_(owner='a'),
+            self.template().with_name('b').with_(owner='b'),
+            Command(name='alone', config={'command': 'pwd'}),
+        ]
+
+        loaded = self.dump_and_load(*jobs)
+
+        self.assertSameFlow(jobs, loaded)
+        self.assertIn(
+            "job_0 = base_0.with_name('a').with_(owner='a')\n", self.content)
+        self.assertIn("job_2 = Command(\n    name='alone',", self.content)
+
+    def test_jobs_sharing_nothing_get_no_base(self):
+        jobs = [
+            self.template().with_name('a'),
+            self.template().with_name('b'),
+            Command(name='first', config={'command': 'pwd'}),
+            Command(name='second', config={'command': 'ls'}),
+        ]
+
+        loaded = self.dump_and_load(*jobs)
+
+        self.assertSameFlow(jobs, loaded)
+        self.assertEqual(1, self.content.count('\nbase_'))
+        self.assertEqual(
+            self.content.count('base_0'), self.content.count('base_'))
+        self.assertNotIn('Command().with_()', self.content)
+
+    def test_nested_and_reused_nodes(self):
+        inner = self.template().with_name('inner')
+        other = self.template().with_name('other')
+        flow = self.template().with_name('flow').with_nodes(inner, other)
+        outer = Job(name='outer', nodes=[flow, inner])
+
+        loaded = self.dump_and_load(flow, outer)
+
+        self.assertSameFlow([flow, outer], loaded)
+        self.assertEqual(1, self.content.count("with_name('inner')"))
+        self.assertTrue(self.content.startswith(
+            'from auror_core.v2.job import Command, Job\n\n\n'))
+
+    @skipUnless(pycodestyle, 'pycodestyle is not installed')
+    def test_dumped_file_is_pep8_clean(self):
+        jobs = [
+            self.template().with_name('job_{}'.format(number))
+            .with_(long='x ' * 60)
+            .with_nodes(self.template().with_name('node_{}'.format(number)))
+            for number in range(3)
+        ]
+
+        self.assertSameFlow(jobs, self.dump_and_load(*jobs))
+        style = pycodestyle.StyleGuide(quiet=True)
+        report = style.check_files(['{}/flow.py'.format(self.tem_dir)])
+        self.assertEqual(0, report.total_errors)
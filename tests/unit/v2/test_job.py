@@ -42,7 +42,7 @@ class JobTest(TestCase):
     def test_with_dependencies(self):
         data_job = Job("test_job_name_2", ["test_job_name_2"], {"driver.memory": "5g"})
         content = self.data_job.with_dependencies(data_job)
-        expected = ["test_job_name_2"]
+        expected = ("test_job_name_2",)
         actual = content.dependencies
 
         self.assertEqual(expected, actual)
@@ -90,3 +90,47 @@ class JobTest(TestCase):
 
         self.assertEqual(None, content.properties["nodes"][0].get("dependsOn"))
         self.assertEqual("command", content.properties["nodes"][0]["type"])
+
+
+class CompactJobTest(TestCase):
+
+    def test_jobs_have_no_instance_dict(self):
+        job = Command().with_name("a").with_command("echo").with_another_command("echo 2")
+
+        self.assertFalse(hasattr(job, "__dict__"))
+
+    def test_properties_are_only_allocated_when_used(self):
+        job = Command().with_name("a").with_command("echo")
+
+        self.assertIsNone(job._properties)
+        self.assertEqual(job, Command().with_name("a").with_command("echo"))
+        self.assertIsNone(job._properties)
+        self.assertEqual({"nodes": []}, job.properties)
+
+    def test_jobs_can_be_pickled(self):
+        import pickle
+
+        job = Command().with_name("a").with_command("echo") \
+            .with_another_command("echo 2").with_dependencies("b")
+
+        self.assertEqual(job, pickle.loads(pickle.dumps(job, 2)))
+
+
+class FanOutTest(TestCase):
+
+    def test_one_job_per_row(self):
+        template = Command().with_command("run ${date}") \
+            .with_config({"retries": "3"}).with_dependencies("start")
+
+        jobs = template.fan_out([
+            {"name": "first", "date": "2020-01-01"},
+            {"name": "second", "date": "2020-01-02", "dependencies": [template]},
+        ])
+
+        self.assertEqual(
+            template.with_name("first").with_(date="2020-01-01"), jobs[0])
+        self.assertEqual(
+            template.with_name("second").with_(date="2020-01-02")
+            .with_dependencies("DefaultJob"),
+            jobs[1])
+        self.assertIs(template.config, jobs[1].config)
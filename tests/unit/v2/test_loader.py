@@ -7,7 +7,7 @@ import mock
 from unittest import TestCase
 
 from auror_core.v2.job import Job, Command
-from auror_core.v2.loader import Loader
+from auror_core.v2.loader import Loader, LazyJobs
 
 
 class LoaderTest(TestCase):
@@ -18,7 +18,7 @@ class LoaderTest(TestCase):
         self.assertTrue('File does not exists' in str(context.exception))
     
     @mock.patch('auror_core.v2.loader.os')
-    @mock.patch('auror_core.v2.loader.yaml')
+    @mock.patch('auror_core.v2.yaml_backend')
     @mock.patch('auror_core.v2.loader.open')
     def test_should_return_command_type_job_list(self, mock_os, mock_yaml, mock_open):
         job = {
@@ -30,7 +30,7 @@ class LoaderTest(TestCase):
             'type': 'command'
         }
         mock_os.path.exists.return_value = True
-        mock_yaml.safe_load.return_value = {'nodes': [job, job]}
+        mock_yaml.load.return_value = {'nodes': [job, job]}
 
         loader = Loader('/flow/path/flow.yaml')
         jobs = loader.as_job_objects()
@@ -40,7 +40,7 @@ class LoaderTest(TestCase):
         self.assertTrue(all([isinstance(job, Job) for job in jobs]))
     
     @mock.patch('auror_core.v2.loader.os')
-    @mock.patch('auror_core.v2.loader.yaml')
+    @mock.patch('auror_core.v2.yaml_backend')
     @mock.patch('auror_core.v2.loader.open')
     def test_should_return_embbed_flow(self, mock_os, mock_yaml, mock_open):
         job = {
@@ -53,7 +53,7 @@ class LoaderTest(TestCase):
         }
         job['nodes'] = [job.copy(),]
         mock_os.path.exists.return_value = True
-        mock_yaml.safe_load.return_value = {'nodes': [job,]}
+        mock_yaml.load.return_value = {'nodes': [job,]}
 
         loader = Loader('/flow/path/flow.yaml')
         jobs = loader.as_job_objects()
@@ -67,3 +67,121 @@ class LoaderTest(TestCase):
 
         self.assertEqual(1, len(jobs))
         self.assertEqual(expected_job, jobs[0])
+
+
+class LoaderIterJobObjectsTest(TestCase):
+
+    FLOW = (
+        'config:\n'
+        '  retries: 2\n'
+        'nodes:\n'
+        '- name: first\n'
+        '  type: command\n'
+        '  config:\n'
+        '    command: echo 1\n'
+        '    command.1: echo 2\n'
+        '- name: embedded\n'
+        '  type: command\n'
+        '  dependsOn:\n'
+        '  - first\n'
+        '  config:\n'
+        '    command: echo 3\n'
+        '  nodes:\n'
+        '  - name: inner\n'
+        '    type: command\n'
+        '    config:\n'
+        '      command: echo 4\n'
+    )
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.flow_path = os.path.join(self.test_dir, 'flow.flow')
+        with open(self.flow_path, 'w') as flow:
+            flow.write(self.FLOW)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_should_yield_the_same_jobs_as_as_job_objects(self):
+        loader = Loader(self.flow_path)
+
+        self.assertEqual(
+            loader.as_job_objects(), list(loader.iter_job_objects()))
+
+    def test_should_yield_jobs_one_at_a_time(self):
+        jobs = Loader(self.flow_path).iter_job_objects()
+
+        first = next(jobs)
+        self.assertIsInstance(first, Command)
+        self.assertEqual('first', first.name)
+        self.assertEqual('echo 2', first.extra['command.1'])
+        self.assertEqual(['embedded'], [job.name for job in jobs])
+
+    def test_should_build_nested_nodes_only_when_accessed(self):
+        embedded = list(Loader(self.flow_path).iter_job_objects())[1]
+
+        self.assertIsInstance(embedded.nodes, LazyJobs)
+        self.assertEqual(1, len(embedded.nodes))
+        self.assertFalse(embedded.nodes.is_built())
+        self.assertEqual(('first',), embedded.dependencies)
+
+        inner = embedded.nodes[0]
+        self.assertTrue(embedded.nodes.is_built())
+        self.assertIsInstance(inner, Command)
+        self.assertEqual('inner', inner.name)
+
+
+class LoaderAsFlowTest(TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.flow_path = os.path.join(self.test_dir, 'flow.flow')
+        with open(self.flow_path, 'w') as flow:
+            flow.write(LoaderIterJobObjectsTest.FLOW)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_should_index_the_loaded_jobs(self):
+        flow = Loader(self.flow_path).as_flow()
+
+        self.assertEqual(['first', 'embedded'], list(flow.jobs))
+        self.assertEqual('echo 3', flow['embedded'].extra['command'])
+        self.assertEqual(['embedded'], flow.dependents['first'])
+        self.assertEqual(
+            ['first', 'embedded'],
+            [job.name for job in flow.of_type('command')])
+        self.assertEqual('inner', flow.find('embedded/inner').name)
+        self.assertEqual([], flow.errors())
+
+    def test_should_keep_the_type_of_plugin_jobs(self):
+        with open(self.flow_path, 'w') as flow:
+            flow.write(
+                'nodes:\n'
+                '- name: submit\n'
+                '  type: spark\n'
+                '  config:\n'
+                '    command: spark-submit\n'
+                '- name: other\n'
+                '  type: command\n'
+                '  config:\n'
+                '    command: echo\n')
+
+        flow = Loader(self.flow_path).as_flow()
+
+        self.assertEqual(
+            ['submit'], [job.name for job in flow.of_type('spark')])
+        self.assertEqual(
+            ['other'], [job.name for job in flow.of_type('command')])
+        self.assertIsInstance(flow['submit'], Command)
+        self.assertEqual('spark', flow['submit']._type)
+
+    def test_should_build_again_after_as_flow(self):
+        loader = Loader(self.flow_path)
+
+        flow = loader.as_flow()
+        jobs = loader.as_job_objects()
+
+        self.assertEqual(list(flow.jobs.values()), jobs)
+        self.assertEqual('inner', jobs[1].nodes[0].name)
+        self.assertEqual(jobs, loader.as_job_objects())
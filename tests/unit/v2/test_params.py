@@ -4,7 +4,7 @@
 from os import path
 import shutil, tempfile
 from unittest import TestCase
-from auror_core.v2.params import Params, Env, ParamsJoin
+from auror_core.v2.params import Params, Env, ParamsJoin, merge_config
 
 
 class ParamsTest(TestCase):
@@ -36,6 +36,15 @@ class ParamsTest(TestCase):
             expected = 'config:\n  param_name_1: value_1\n  param_name_2: value_2\n'
             self.assertEqual(f.read(), expected)
 
+    def test_write_keeps_the_config_already_in_the_flow(self):
+        name = "{}.flow".format(path.basename(self.test_dir))
+        self.data_params._write(self.test_dir)
+        Env(USER="hadoop")._write(self.test_dir)
+        Params(param_name_2="other")._write(self.test_dir)
+        with open(path.join(self.test_dir, name)) as f:
+            expected = 'config:\n  env.USER: hadoop\n  param_name_1: value_1\n  param_name_2: other\n'
+            self.assertEqual(f.read(), expected)
+
 
 class EnvParamsTest(TestCase):
 
@@ -81,3 +90,28 @@ class ParamsJoinTest(TestCase):
             self.assertTrue("hadoop" in content)
             self.assertTrue("yarn" in content)
 
+
+class MergeConfigTest(TestCase):
+
+    def test_later_params_win(self):
+        params = Params(user="first", date="today")
+        env = Env(USER="hadoop")
+        join = ParamsJoin("all", ",")(Params(user="joined"), env)
+
+        config = merge_config([params, env, join, Params(user="last")])
+
+        self.assertEqual(
+            {"user": "last", "date": "today", "env.USER": "hadoop", "all": "joined,hadoop"},
+            config)
+
+    def test_dicts_are_merged_as_they_are(self):
+        self.assertEqual(
+            {"a": "2", "b": "1"},
+            merge_config([{"a": "1", "b": "1"}, Params(a="2")]))
+
+    def test_params_are_not_changed(self):
+        join = ParamsJoin("all", ",")(Params(user="joined"))
+
+        merge_config([Params(user="first"), join])
+
+        self.assertIsNone(join._properties)
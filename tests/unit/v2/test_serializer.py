@@ -0,0 +1,119 @@
+from unittest import TestCase
+
+from auror_core.v2 import yaml_backend
+from auror_core.v2.job import Command
+from auror_core.v2.params import Params, Env
+from auror_core.v2.serializer import FlowSerializer
+
+
+class CountingCommand(Command):
+    hooks = 0
+
+    def before_add_hook(self):
+        CountingCommand.hooks += 1
+        return self.with_(hooked="yes")
+
+
+class Spark(Command):
+    _type = "spark"
+
+    def _get_node(self, job):
+        node = super(Spark, self)._get_node(job)
+        node["config"]["spark.master"] = "yarn"
+        return node
+
+
+class FlowSerializerTest(TestCase):
+
+    def setUp(self):
+        CountingCommand.hooks = 0
+        self.inner = Command(name="inner", config={"command": "echo inner"})
+        self.flow = Command(
+            name="flow",
+            config={"command": "echo flow"},
+            nodes=[self.inner],
+        ).with_(retries="2").with_dependencies("first")
+
+    def test_nested_nodes(self):
+        serializer = FlowSerializer().add_jobs(self.flow)
+
+        self.assertEqual({"nodes": [{
+            "name": "flow",
+            "type": "command",
+            "config": {"command": "echo flow", "retries": "2"},
+            "dependsOn": ["first"],
+            "nodes": [{
+                "name": "inner",
+                "type": "command",
+                "config": {"command": "echo inner"},
+                "nodes": [],
+            }],
+        }]}, serializer.as_dict())
+
+    def test_jobs_are_not_changed(self):
+        FlowSerializer().add_jobs(self.flow, self.flow)
+
+        self.assertEqual({"nodes": []}, self.flow.properties)
+        self.assertEqual({"nodes": []}, self.inner.properties)
+        self.assertEqual({"command": "echo flow"}, dict(self.flow.config))
+
+    def test_reused_sub_flows_are_serialized_once(self):
+        shared = CountingCommand(name="shared", config={"command": "pwd"})
+        first = Command(name="first", nodes=[shared])
+        second = Command(name="second", nodes=[shared])
+
+        serializer = FlowSerializer().add_jobs(first, second)
+
+        self.assertEqual(1, CountingCommand.hooks)
+        first_node, second_node = serializer.nodes
+        self.assertIs(first_node["nodes"][0], second_node["nodes"][0])
+        self.assertEqual("yes", first_node["nodes"][0]["config"]["hooked"])
+        self.assertNotIn("&", serializer.dumps())
+        self.assertEqual(
+            serializer.as_dict(), yaml_backend.load(serializer.dumps()))
+
+    def test_deeply_nested_flow(self):
+        flow = Command(name="level_0", config={"command": "echo"})
+        for level in range(1, 200):
+            flow = Command(name="level_{}".format(level), nodes=[flow])
+
+        node = FlowSerializer().node(flow)
+        for level in reversed(range(200)):
+            self.assertEqual("level_{}".format(level), node["name"])
+            node = (node["nodes"] or [None])[0]
+        self.assertIsNone(node)
+
+    def test_params_become_the_flow_config(self):
+        serializer = FlowSerializer() \
+            .add_params(Params(user="hadoop")) \
+            .add_jobs(self.inner)
+
+        self.assertEqual({"user": "hadoop"}, serializer.as_dict()["config"])
+
+    def test_params_added_in_many_calls_are_merged(self):
+        serializer = FlowSerializer() \
+            .add_params(Params(user="hadoop", date="today")) \
+            .add_params(Env(USER="hadoop"), Params(user="spark"))
+
+        self.assertEqual(
+            {"user": "spark", "date": "today", "env.USER": "hadoop"},
+            serializer.as_dict()["config"])
+
+    def test_nodes_come_from_the_job_get_node(self):
+        spark = Spark(name="spark")
+        flow = Command(name="flow", nodes=[spark, spark])
+
+        serializer = FlowSerializer().add_jobs(flow, spark)
+        nodes = serializer.as_dict()["nodes"]
+
+        self.assertEqual({"spark.master": "yarn"}, nodes[0]["nodes"][0]["config"])
+        self.assertIs(nodes[0]["nodes"][0], nodes[1])
+        self.assertIs(nodes[0]["nodes"][0], nodes[0]["nodes"][1])
+
+    def test_overridden_get_node_children_keep_the_memo(self):
+        inner = CountingCommand(name="inner")
+        spark = Spark(name="spark", nodes=[inner])
+
+        FlowSerializer().add_jobs(spark, Command(name="other", nodes=[inner]))
+
+        self.assertEqual(1, CountingCommand.hooks)
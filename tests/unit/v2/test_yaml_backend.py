@@ -0,0 +1,94 @@
+import importlib
+import sys
+import types
+
+import mock
+import yaml
+
+from unittest import TestCase, skipUnless
+
+import auror_core.v2
+
+from auror_core.v2 import yaml_backend
+
+
+FLOW = {
+    'config': {
+        'failure.emails': 'email@gmail.com',
+        'retries': '2',
+        'env.SPARK_MASTER': 'yarn',
+    },
+    'nodes': [
+        {
+            'name': 'job_{}'.format(number),
+            'type': 'command',
+            'config': {
+                'command': "${python} -c 'from test import x; x()'",
+                'command.1': 'bash echo "quoted: value" # not a comment',
+                'timeout': 30,
+                'enabled': True,
+                'unicode': u'ol\xe1 mundo',
+                'long': 'word ' * 40,
+            },
+            'dependsOn': ['job_{}'.format(number - 1)] if number else [],
+            'nodes': [],
+        }
+        for number in range(3)
+    ],
+}
+
+
+class YamlBackendTest(TestCase):
+
+    def test_backend_is_reported(self):
+        expected = 'libyaml' if yaml.__with_libyaml__ else 'python'
+        self.assertEqual(expected, yaml_backend.BACKEND)
+
+    def test_dump_and_load_round_trip(self):
+        self.assertEqual(FLOW, yaml_backend.load(yaml_backend.dump(FLOW)))
+
+    def test_dump_output_is_the_same_as_pure_python_dump(self):
+        expected = yaml.dump(FLOW, default_flow_style=False)
+        self.assertEqual(expected, yaml_backend.dump(FLOW))
+
+    @skipUnless(yaml.__with_libyaml__, 'PyYAML built without libyaml')
+    def test_libyaml_load_is_the_same_as_pure_python_load(self):
+        content = yaml.dump(FLOW, default_flow_style=False)
+        self.assertEqual(yaml.safe_load(content), yaml_backend.load(content))
+
+    def test_fallback_to_pure_python_without_libyaml(self):
+        yaml_without_libyaml = types.ModuleType('yaml')
+        yaml_without_libyaml.__dict__.update(vars(yaml))
+        for name in ('CSafeLoader', 'CSafeDumper'):
+            yaml_without_libyaml.__dict__.pop(name, None)
+
+        with mock.patch.dict(sys.modules, {'yaml': yaml_without_libyaml}), \
+                mock.patch.object(auror_core.v2, 'yaml_backend'):
+            del sys.modules['auror_core.v2.yaml_backend']
+            fallback = importlib.import_module('auror_core.v2.yaml_backend')
+
+        self.assertEqual('python', fallback.BACKEND)
+        self.assertIs(yaml.SafeLoader, fallback.SafeLoader)
+        self.assertIs(yaml.SafeDumper, fallback.SafeDumper)
+        self.assertEqual(FLOW, fallback.load(fallback.dump(FLOW)))
+        self.assertEqual(
+            FLOW['nodes'],
+            list(fallback.iter_items(fallback.dump(FLOW), 'nodes')))
+
+    def test_iter_items_yields_each_item_of_the_given_key(self):
+        items = yaml_backend.iter_items(yaml_backend.dump(FLOW), 'nodes')
+
+        self.assertEqual(FLOW['nodes'][0], next(items))
+        self.assertEqual(FLOW['nodes'][1:], list(items))
+
+    def test_iter_items_resolves_aliases_between_items(self):
+        content = 'nodes:\n- &job {name: a}\n- *job\nconfig: {}\n'
+        items = list(yaml_backend.iter_items(content, 'nodes'))
+
+        self.assertEqual([{'name': 'a'}, {'name': 'a'}], items)
+
+    def test_iter_items_without_the_given_key(self):
+        content = yaml_backend.dump({'config': FLOW['config']})
+
+        self.assertEqual([], list(yaml_backend.iter_items(content, 'nodes')))
+        self.assertEqual([], list(yaml_backend.iter_items('', 'nodes')))